@@ -7,7 +7,7 @@
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
-from typing import Optional
+from typing import List, Optional
 import os
 from pathlib import Path
 
@@ -92,6 +92,30 @@ class Settings(BaseSettings):
         description="是否验证 SSL 证书（如遇到 SSL 错误可设为 False）"
     )
     
+    # 会话历史存储配置
+    redis_url: str = Field(
+        default="",
+        description="Redis 连接地址（留空则会话历史保存在进程内存中，仅适合单进程部署）"
+    )
+    session_history_max_messages: int = Field(
+        default=50,
+        description="Redis 中每个会话最多保留的消息条数"
+    )
+    session_history_ttl: int = Field(
+        default=36000,
+        description="Redis 中会话历史的过期时间（秒）"
+    )
+    response_cache_ttl: int = Field(
+        default=300,
+        description="/api/chat 响应在 Redis 中的缓存时间（秒），0 表示不缓存；未配置 Redis 时不缓存"
+    )
+    
+    # Web 服务跨域配置
+    cors_origins: List[str] = Field(
+        default=["http://localhost:8001", "http://127.0.0.1:8001"],
+        description="允许跨域访问 Web 接口的来源列表（环境变量中使用 JSON 数组格式）"
+    )
+    
     # RAG 嵌入模型配置
     use_cloud_embedding: bool = Field(
         default=True,
@@ -4,10 +4,11 @@
 提供与码云 AI Serverless API 交互的客户端类
 """
 
+import asyncio
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Dict, List, Optional, Iterator, Any
+from typing import Dict, List, Optional, Iterator, AsyncIterator, Any
 import json
 import warnings
 from .config import settings
@@ -46,6 +47,10 @@ class GiteeAIClient:
         # 创建带重试机制的 session
         self.session = self._create_session()
         
+        # 异步流式接口使用的 httpx 客户端，首次使用时创建
+        self._async_client = None
+        self._async_client_loop = None
+        
         if not self.api_key:
             raise ValueError(
                 "未提供 API Key。请通过参数传入或在 .env 文件中设置 GITEE_AI_API_KEY"
@@ -172,6 +177,123 @@ class GiteeAIClient:
                     except json.JSONDecodeError:
                         continue
     
+    def _get_async_client(self):
+        """
+        获取异步 HTTP 客户端，首次调用时创建
+        
+        客户端的连接池绑定在创建它的事件循环上，事件循环变化时重新创建。
+        
+        Returns:
+            httpx.AsyncClient
+        """
+        import httpx
+        
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    verify=self.ssl_verify,
+                    retries=settings.max_retries,
+                    # 多个并发流式请求共享连接池，保留足够的空闲连接避免重复握手
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)
+                )
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def awarm_up(self, timeout: float = 5) -> None:
+        """
+        预先建立到 API 的连接（含 TLS 握手），减少第一次流式请求的首字延迟
+        
+        Args:
+            timeout: 超时时间（秒）
+        """
+        client = self._get_async_client()
+        await client.head(self.base_url, timeout=timeout)
+    
+    async def aclose(self) -> None:
+        """关闭异步 HTTP 客户端及其连接池"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+    
+    async def achat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        timeout: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[Dict]:
+        """
+        异步调用流式聊天补全 API
+        
+        网络读取不阻塞事件循环，多个流式请求可以在同一个 worker 中并发进行。
+        
+        Args:
+            messages: 消息列表，格式为 [{"role": "user", "content": "..."}]
+            temperature: 温度参数，控制随机性 (0-2)
+            max_tokens: 最大生成 token 数
+            timeout: 自定义超时时间（秒），默认使用配置中的值
+            **kwargs: 其他模型参数
+            
+        Yields:
+            每个数据块的字典
+        """
+        import httpx
+        
+        url = f"{self.base_url}/chat/completions"
+        
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True,
+            **kwargs
+        }
+        
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        
+        request_timeout = timeout if timeout is not None else settings.request_timeout
+        client = self._get_async_client()
+        
+        try:
+            async with client.stream(
+                "POST",
+                url,
+                headers=self._get_headers(),
+                json=payload,
+                timeout=request_timeout
+            ) as response:
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if line.startswith('data: '):
+                        data_str = line[6:]  # 去掉 'data: ' 前缀
+                        if data_str.strip() == '[DONE]':
+                            break
+                        try:
+                            yield json.loads(data_str)
+                        except json.JSONDecodeError:
+                            continue
+        except httpx.ConnectError as e:
+            if "SSL" in str(e) or "CERTIFICATE" in str(e).upper():
+                raise Exception(
+                    f"SSL 连接错误: {str(e)}\n"
+                    f"建议解决方案:\n"
+                    f"1. 在 .env 文件中设置 SSL_VERIFY=false\n"
+                    f"2. 更新系统的 SSL 证书\n"
+                    f"3. 检查网络代理设置"
+                )
+            raise Exception(f"API 请求失败: {str(e)}")
+        except httpx.HTTPError as e:
+            raise Exception(f"API 请求失败: {str(e)}")
+    
     def simple_chat(self, user_message: str, system_message: Optional[str] = None, timeout: Optional[int] = None) -> str:
         """
         简单的单轮对话方法
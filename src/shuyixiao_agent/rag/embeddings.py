@@ -84,6 +84,38 @@ class EmbeddingManager(Embeddings):
         
         return embedding.tolist()
     
+    def encode_bulk(self, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        """
+        多进程批量嵌入大量文本
+        
+        有多块 GPU 时每块 GPU 一个进程，否则启动多个 CPU 进程，适用于大规模文档导入
+        
+        Args:
+            texts: 文本列表
+            batch_size: 每个进程的批处理大小
+            
+        Returns:
+            嵌入向量列表
+        """
+        if not texts:
+            return []
+        
+        pool = self.model.start_multi_process_pool()
+        try:
+            embeddings = self.model.encode_multi_process(
+                texts,
+                pool,
+                batch_size=batch_size
+            )
+        finally:
+            self.model.stop_multi_process_pool(pool)
+        
+        if self.normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.maximum(norms, 1e-12)
+        
+        return embeddings.tolist()
+    
     def get_embedding_dimension(self) -> int:
         """获取嵌入向量维度"""
         return self.model.get_sentence_embedding_dimension()
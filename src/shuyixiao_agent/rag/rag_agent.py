@@ -488,12 +488,7 @@ class RAGAgent:
         success = self.vector_store.delete_document_by_id(doc_id)
         if success:
             # 同时从关键词检索器中移除（重新加载所有文档）
-            all_docs = self.vector_store.list_documents()
-            documents = [
-                Document(page_content=doc['text'], metadata=doc['metadata'])
-                for doc in all_docs
-            ]
-            self.keyword_retriever.update_documents(documents)
+            self._rebuild_keyword_index()
         return success
     
     def batch_delete_documents(self, doc_ids: List[str]) -> tuple:
@@ -509,15 +504,26 @@ class RAGAgent:
         success_count, failed_ids = self.vector_store.batch_delete_documents(doc_ids)
         
         # 更新关键词检索器
-        all_docs = self.vector_store.list_documents()
-        documents = [
-            Document(page_content=doc['text'], metadata=doc['metadata'])
-            for doc in all_docs
-        ]
-        self.keyword_retriever.update_documents(documents)
+        self._rebuild_keyword_index()
         
         return success_count, failed_ids
     
+    def _rebuild_keyword_index(self):
+        """
+        从向量存储重新加载所有文档，重建关键词检索索引
+        
+        向量删除已经完成，读取文档出错时只打印错误，不向调用方抛出
+        """
+        try:
+            documents = [
+                Document(page_content=doc['text'], metadata=doc['metadata'])
+                for doc in self.vector_store.iter_documents()
+            ]
+        except Exception as e:
+            print(f"⚠️  重建关键词索引时出错: {e}")
+            return
+        self.keyword_retriever.update_documents(documents)
+    
     def clear_knowledge_base(self):
         """清空知识库"""
         self.vector_store.clear()
@@ -4,15 +4,116 @@
 通过 ReRank 模型提升召回质量
 """
 
-from typing import List, Tuple, Optional
+from typing import List, Dict, Tuple, Optional
 from langchain_core.documents import Document
 from sentence_transformers import CrossEncoder
+import hashlib
+import heapq
+import os
+import re
+import numpy as np
+import orjson
 import requests
 import time
+import torch
 
 from ..config import settings
 
 
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    获取分数最高的 k 个下标（按分数降序）
+    
+    Args:
+        scores: 分数数组
+        k: 需要的数量
+        
+    Returns:
+        下标数组
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+# 每个 token 对应的最大字符数估计（英文约 4 个字符，中文约 1 个字符）
+_CHARS_PER_TOKEN = 4
+
+# 字面查询：引号包裹的短语，或包含 . / _ - 的单个标识符（文件名、路径、标签等）
+_LITERAL_QUERY_PATTERN = re.compile(
+    r'"[^"]+"|“[^”]+”|(?=.*[A-Za-z0-9])[A-Za-z0-9]*[./_-][A-Za-z0-9./_-]*'
+)
+
+
+def _configure_cpu_threads() -> None:
+    """
+    设置 PyTorch 的 CPU 推理线程数
+    
+    交叉编码器在 CPU 上使用 4-8 个算子内线程效果最好，算子间并行只会带来调度开销
+    """
+    torch.set_num_threads(min(os.cpu_count() or 4, 8))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # 算子间线程池已经启动（例如已有模型完成过推理），此时无法再修改
+        pass
+
+
+def _is_literal_query(query: str, documents: List[Document]) -> bool:
+    """
+    判断查询是否为精确字面查找
+    
+    这类查询（引号短语、文件名、标签等）依赖精确匹配，语义重排序无法带来提升
+    
+    Args:
+        query: 查询文本
+        documents: 文档列表
+        
+    Returns:
+        是否为字面查询
+    """
+    query = query.strip()
+    if not query:
+        return False
+    
+    if _LITERAL_QUERY_PATTERN.fullmatch(query):
+        return True
+    
+    # 查询与文档标题或来源文件名完全一致
+    for doc in documents:
+        title = doc.metadata.get("title")
+        source = doc.metadata.get("source")
+        if query == title or (source and query == os.path.basename(str(source))):
+            return True
+    
+    return False
+
+
+def _sort_by_scores(
+    documents: List[Document],
+    scores: Optional[List[float]],
+    k: int
+) -> List[Tuple[Document, float]]:
+    """
+    按原始分数排序并截取前 k 个
+    
+    Args:
+        documents: 文档列表
+        scores: 原始分数列表（可选，缺省时保持原顺序）
+        k: 返回的文档数量
+        
+    Returns:
+        (文档, 分数) 元组列表
+    """
+    if scores:
+        return heapq.nlargest(k, zip(documents, scores), key=lambda x: x[1])
+    return [(doc, 1.0) for doc in documents[:k]]
+
+
 class Reranker:
     """
     重排序器
@@ -37,6 +138,10 @@ class Reranker:
         self.model_name = model_name
         self.device = device or settings.embedding_device
         self.top_k = top_k or settings.rerank_top_k
+        self.max_length = 512
+        
+        if self.device.startswith("cpu"):
+            _configure_cpu_threads()
         
         # 加载交叉编码器模型
         print(f"正在加载重排序模型: {self.model_name} (设备: {self.device})")
@@ -44,7 +149,7 @@ class Reranker:
             self.model = CrossEncoder(
                 self.model_name,
                 device=self.device,
-                max_length=512
+                max_length=self.max_length
             )
             print(f"重排序模型加载完成")
         except Exception as e:
@@ -77,21 +182,15 @@ class Reranker:
         k = top_k or self.top_k
         k = min(k, len(documents))  # 确保不超过文档数量
         
-        # 如果模型加载失败，使用原始分数
-        if self.model is None:
-            if scores:
-                sorted_results = sorted(
-                    zip(documents, scores),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-                return sorted_results[:k]
-            else:
-                return [(doc, 1.0) for doc in documents[:k]]
+        # 如果模型加载失败，或查询是精确字面查找，直接使用原始分数
+        if self.model is None or _is_literal_query(query, documents):
+            return _sort_by_scores(documents, scores, k)
         
         try:
             # 准备输入对（查询-文档对）
-            pairs = [(query, doc.page_content) for doc in documents]
+            # 超出 max_length 的部分会被模型截断，提前截取文本可避免对整篇长文档分词
+            max_chars = self.max_length * _CHARS_PER_TOKEN
+            pairs = [(query, doc.page_content[:max_chars]) for doc in documents]
             
             # 计算重排序分数
             rerank_scores = self.model.predict(pairs)
@@ -108,15 +207,7 @@ class Reranker:
         except Exception as e:
             print(f"重排序失败: {e}")
             # 降级到原始分数排序
-            if scores:
-                sorted_results = sorted(
-                    zip(documents, scores),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-                return sorted_results[:k]
-            else:
-                return [(doc, 1.0) for doc in documents[:k]]
+            return _sort_by_scores(documents, scores, k)
     
     def rerank_results(
         self,
@@ -140,6 +231,85 @@ class Reranker:
         
         documents, scores = zip(*results)
         return self.rerank(query, list(documents), list(scores), top_k)
+    
+    def rerank_many(
+        self,
+        queries: List[str],
+        docs_per_query: List[List[Document]],
+        top_k: Optional[int] = None
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        批量重排序多个查询
+        
+        将所有查询的（查询-文档）对合并为一次模型推理，减少逐次调用的开销
+        
+        Args:
+            queries: 查询文本列表
+            docs_per_query: 每个查询对应的文档列表
+            top_k: 每个查询返回的文档数量
+            
+        Returns:
+            每个查询的 (文档, 重排序分数) 元组列表
+            
+        Raises:
+            ValueError: queries 与 docs_per_query 数量不一致
+        """
+        if len(queries) != len(docs_per_query):
+            raise ValueError(
+                f"queries 与 docs_per_query 数量不一致: {len(queries)} != {len(docs_per_query)}"
+            )
+        
+        if self.model is None:
+            return [
+                self.rerank(query, documents, top_k=top_k)
+                for query, documents in zip(queries, docs_per_query)
+            ]
+        
+        k = top_k or self.top_k
+        max_chars = self.max_length * _CHARS_PER_TOKEN
+        
+        # 与 rerank 一致，精确字面查询不经过模型，直接保持原顺序
+        literal = [
+            _is_literal_query(query, documents)
+            for query, documents in zip(queries, docs_per_query)
+        ]
+        
+        # 拼接所有查询的输入对，并记录每个查询在结果中的起止位置
+        pairs = []
+        offsets = [0]
+        for query, documents, is_literal in zip(queries, docs_per_query, literal):
+            if not is_literal:
+                pairs.extend((query, doc.page_content[:max_chars]) for doc in documents)
+            offsets.append(len(pairs))
+        
+        if not pairs:
+            return [
+                _sort_by_scores(documents, None, k)
+                for documents in docs_per_query
+            ]
+        
+        try:
+            rerank_scores = np.asarray(self.model.predict(pairs, batch_size=64))
+        except Exception as e:
+            print(f"批量重排序失败: {e}")
+            return [
+                _sort_by_scores(documents, None, k)
+                for documents in docs_per_query
+            ]
+        
+        results = []
+        for i, documents in enumerate(docs_per_query):
+            if literal[i]:
+                results.append(_sort_by_scores(documents, None, k))
+                continue
+            query_scores = rerank_scores[offsets[i]:offsets[i + 1]]
+            top_indices = _top_k_indices(query_scores, min(k, len(documents)))
+            results.append([
+                (documents[j], float(query_scores[j]))
+                for j in top_indices
+            ])
+        
+        return results
 
 
 class SimpleReranker(Reranker):
@@ -188,41 +358,109 @@ class SimpleReranker(Reranker):
         if scores is None:
             scores = [1.0] * len(documents)
         
-        # 计算调整后的分数
-        adjusted_scores = []
+        # 向量化计算调整后的分数，避免逐文档的 Python 循环
         query_lower = query.lower()
+        contents = [doc.page_content for doc in documents]
         
-        for doc, base_score in zip(documents, scores):
-            content_lower = doc.page_content.lower()
-            
-            # 分数调整因子
-            boost = 1.0
-            
-            # 如果文档包含完整的查询短语，提高分数
-            if query_lower in content_lower:
-                boost *= 1.5
-            
-            # 根据文档长度调整（过短或过长的文档降低分数）
-            doc_length = len(doc.page_content)
-            if doc_length < 50:
-                boost *= 0.8
-            elif doc_length > 2000:
-                boost *= 0.9
-            
-            # 如果文档有元数据中的优先级标记，调整分数
-            if "priority" in doc.metadata:
-                boost *= doc.metadata["priority"]
-            
-            adjusted_scores.append(base_score * boost)
+        # 如果文档包含完整的查询短语，提高分数
+        contains = np.fromiter(
+            (query_lower in content.lower() for content in contents),
+            dtype=bool,
+            count=len(contents)
+        )
+        
+        # 根据文档长度调整（过短或过长的文档降低分数）
+        lengths = np.fromiter(map(len, contents), dtype=np.int64, count=len(contents))
+        
+        # 如果文档有元数据中的优先级标记，调整分数
+        priorities = np.fromiter(
+            (doc.metadata.get("priority", 1.0) for doc in documents),
+            dtype=np.float64,
+            count=len(documents)
+        )
+        
+        adjusted_scores = (
+            np.asarray(scores, dtype=np.float64)
+            * np.where(contains, 1.5, 1.0)
+            * np.where(lengths < 50, 0.8, np.where(lengths > 2000, 0.9, 1.0))
+            * priorities
+        )
+        
+        # 只需要 top-k，用 argpartition 代替全量排序
+        top_indices = _top_k_indices(adjusted_scores, k)
+        
+        return [(documents[i], float(adjusted_scores[i])) for i in top_indices]
+
+
+class DRFCache:
+    """
+    基于 DRF (Distance-Rank-Frequency) 权重的重排序结果缓存
+    
+    每次写入或命中时为条目累加 Σ relevance^α / rank，容量满时淘汰权重最低的条目，
+    使排名靠前、相关性高且经常被访问的结果保留得更久
+    """
+    
+    def __init__(self, capacity: int = 256, alpha: float = 1.0):
+        """
+        初始化缓存
         
-        # 按调整后的分数排序
-        sorted_results = sorted(
-            zip(documents, adjusted_scores),
-            key=lambda x: x[1],
-            reverse=True
+        Args:
+            capacity: 最大缓存条目数
+            alpha: 相关性分数的指数
+        """
+        self.capacity = capacity
+        self.alpha = alpha
+        self._entries: Dict[bytes, List[Tuple[int, float]]] = {}
+        self._weights: Dict[bytes, float] = {}
+    
+    def _drf_score(self, results: List[Tuple[int, float]]) -> float:
+        """计算一组重排序结果的 DRF 权重"""
+        return sum(
+            max(score, 0.0) ** self.alpha / rank
+            for rank, (_, score) in enumerate(results, start=1)
         )
+    
+    def get(self, key: bytes) -> Optional[List[Tuple[int, float]]]:
+        """
+        读取缓存，命中时提升该条目的权重
+        
+        Args:
+            key: 缓存键
+            
+        Returns:
+            (文档索引, 重排序分数) 元组列表，未命中返回 None
+        """
+        results = self._entries.get(key)
+        if results is not None:
+            self._weights[key] += self._drf_score(results)
+        return results
+    
+    def put(self, key: bytes, results: List[Tuple[int, float]]) -> None:
+        """
+        写入缓存
+        
+        Args:
+            key: 缓存键
+            results: (文档索引, 重排序分数) 元组列表
+        """
+        if self.capacity <= 0:
+            return
+        
+        if key not in self._entries and len(self._entries) >= self.capacity:
+            victim = min(self._weights, key=self._weights.__getitem__)
+            del self._entries[victim]
+            del self._weights[victim]
         
-        return sorted_results[:k]
+        self._entries[key] = results
+        self._weights[key] = self._weights.get(key, 0.0) + self._drf_score(results)
+    
+    def clear(self) -> None:
+        """清空缓存"""
+        self._entries.clear()
+        self._weights.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class CloudReranker:
@@ -244,7 +482,8 @@ class CloudReranker:
         model: Optional[str] = None,
         top_k: Optional[int] = None,
         max_retries: int = 3,
-        timeout: int = 30
+        timeout: int = 30,
+        cache_size: int = 256
     ):
         """
         初始化云端重排序器
@@ -256,6 +495,7 @@ class CloudReranker:
             top_k: 重排序后保留的文档数量
             max_retries: 最大重试次数
             timeout: 请求超时时间
+            cache_size: 重排序结果缓存条目数，0 表示不缓存
         """
         self.api_key = api_key or settings.gitee_ai_api_key
         self.base_url = base_url or settings.gitee_ai_base_url
@@ -263,6 +503,7 @@ class CloudReranker:
         self.top_k = top_k or settings.rerank_top_k
         self.max_retries = max_retries
         self.timeout = timeout
+        self.cache = DRFCache(capacity=cache_size)
         
         if not self.api_key:
             raise ValueError(
@@ -271,6 +512,25 @@ class CloudReranker:
         
         print(f"✓ 使用云端重排序服务: {self.model} (无需下载模型)")
     
+    def _cache_key(self, query: str, doc_texts: List[str], top_k: int) -> bytes:
+        """
+        计算重排序结果的缓存键
+        
+        Args:
+            query: 查询文本
+            doc_texts: 文档文本列表
+            top_k: 返回的文档数量
+            
+        Returns:
+            缓存键
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{self.model}\0{top_k}\0{query}".encode("utf-8"))
+        for text in doc_texts:
+            hasher.update(b"\0")
+            hasher.update(text.encode("utf-8"))
+        return hasher.digest()
+    
     def _call_rerank_api(
         self,
         query: str,
@@ -297,12 +557,13 @@ class CloudReranker:
             "Content-Type": "application/json"
         }
         
-        data = {
+        # 文档内容可能很长，使用 orjson 序列化请求体
+        payload = orjson.dumps({
             "model": self.model,
             "query": query,
             "documents": documents,
             "top_n": top_k
-        }
+        })
         
         # 重试机制
         for attempt in range(self.max_retries):
@@ -310,13 +571,13 @@ class CloudReranker:
                 response = requests.post(
                     url,
                     headers=headers,
-                    json=data,
+                    data=payload,
                     timeout=self.timeout,
                     verify=settings.ssl_verify
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     # 提取重排序结果
                     # 返回格式：[{"index": 0, "relevance_score": 0.95}, ...]
                     rerank_results = [
@@ -366,12 +627,22 @@ class CloudReranker:
         k = top_k or self.top_k
         k = min(k, len(documents))  # 确保不超过文档数量
         
+        # 精确字面查找无需调用云端重排序
+        if _is_literal_query(query, documents):
+            return _sort_by_scores(documents, scores, k)
+        
         try:
             # 提取文档内容
             doc_texts = [doc.page_content for doc in documents]
             
-            # 调用云端重排序 API
-            rerank_results = self._call_rerank_api(query, doc_texts, k)
+            # 相同查询和候选文档的结果直接复用缓存
+            cache_key = self._cache_key(query, doc_texts, k)
+            rerank_results = self.cache.get(cache_key)
+            
+            if rerank_results is None:
+                # 调用云端重排序 API
+                rerank_results = self._call_rerank_api(query, doc_texts, k)
+                self.cache.put(cache_key, rerank_results)
             
             # 构建结果
             sorted_results = [
@@ -6,13 +6,21 @@
 
 from typing import List, Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import heapq
+import bm25s
 import jieba
-from rank_bm25 import BM25Okapi
+import numpy as np
 from langchain_core.documents import Document
 
 from .vector_store import VectorStoreManager
 from ..config import settings
 
+# 所有混合检索器共享的线程池，用于在调用线程执行关键词检索的同时并行执行向量检索；
+# 不为每个检索器单独创建，避免每个缓存的 RAG Agent 都常驻空闲线程
+_RETRIEVAL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hybrid-retrieval")
+
 
 class BaseRetriever(ABC):
     """检索器基类"""
@@ -139,9 +147,32 @@ class KeywordRetriever(BaseRetriever):
             # 简单的空格分词（适用于英文）
             return text.lower().split()
     
+    @staticmethod
+    def _create_bm25(tokenized_corpus: List[List[str]]) -> Optional[bm25s.BM25]:
+        """
+        基于分词结果创建 BM25 索引
+        
+        bm25s 会预先计算稀疏的词项-文档矩阵，查询时只需一次稀疏矩阵运算
+        
+        Args:
+            tokenized_corpus: 分词后的语料
+            
+        Returns:
+            BM25 索引，所有文档分词后都为空时返回 None
+        """
+        # 语料中没有任何词项时 bm25s 会抛出 ValueError，视为没有索引
+        if not any(tokenized_corpus):
+            return None
+        
+        bm25 = bm25s.BM25()
+        bm25.index(tokenized_corpus, show_progress=False)
+        return bm25
+    
     def _build_index(self):
         """构建 BM25 索引"""
         if not self.documents:
+            self.bm25 = None
+            self.tokenized_corpus = []
             return
         
         # 对所有文档进行分词
@@ -151,7 +182,7 @@ class KeywordRetriever(BaseRetriever):
         ]
         
         # 创建 BM25 索引
-        self.bm25 = BM25Okapi(self.tokenized_corpus)
+        self.bm25 = self._create_bm25(self.tokenized_corpus)
     
     def update_documents(self, documents: List[Document]):
         """
@@ -170,8 +201,18 @@ class KeywordRetriever(BaseRetriever):
         Args:
             documents: 要添加的文档列表
         """
+        if not documents:
+            return
+        
+        # 只对新增文档分词，已有文档的分词结果直接复用
         self.documents.extend(documents)
-        self._build_index()
+        self.tokenized_corpus.extend(
+            self._tokenize(doc.page_content)
+            for doc in documents
+        )
+        
+        # BM25 的 IDF 依赖全部语料，需要基于完整分词结果重建
+        self.bm25 = self._create_bm25(self.tokenized_corpus)
     
     def retrieve(
         self,
@@ -198,19 +239,18 @@ class KeywordRetriever(BaseRetriever):
         # 对查询进行分词
         tokenized_query = self._tokenize(query)
         
-        # 计算 BM25 分数
-        scores = self.bm25.get_scores(tokenized_query)
+        k = min(k, len(self.documents))
         
-        # 获取 top-k 结果
-        top_indices = sorted(
-            range(len(scores)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:k]
+        # 计算 BM25 分数，bm25s 直接返回按分数降序的 top-k 结果
+        top_indices, scores = self.bm25.retrieve(
+            [tokenized_query],
+            k=k,
+            show_progress=False
+        )
         
         results = [
-            (self.documents[i], float(scores[i]))
-            for i in top_indices
+            (self.documents[i], float(score))
+            for i, score in zip(top_indices[0], scores[0])
         ]
         
         return results
@@ -228,7 +268,8 @@ class HybridRetriever(BaseRetriever):
         vector_retriever: VectorRetriever,
         keyword_retriever: KeywordRetriever,
         vector_weight: Optional[float] = None,
-        top_k: Optional[int] = None
+        top_k: Optional[int] = None,
+        candidate_multiplier: int = 2
     ):
         """
         初始化混合检索器
@@ -238,12 +279,33 @@ class HybridRetriever(BaseRetriever):
             keyword_retriever: 关键词检索器
             vector_weight: 向量检索的权重 (0-1)，关键词检索权重为 1-vector_weight
             top_k: 默认返回结果数量
+            candidate_multiplier: 每路检索获取 top_k 的倍数，用于合并前扩大候选集
         """
         self.vector_retriever = vector_retriever
         self.keyword_retriever = keyword_retriever
         self.vector_weight = vector_weight or settings.hybrid_search_weight
         self.keyword_weight = 1.0 - self.vector_weight
         self.top_k = top_k or settings.retrieval_top_k
+        self.candidate_multiplier = max(1, candidate_multiplier)
+    
+    @staticmethod
+    def _doc_key(doc: Document) -> bytes:
+        """
+        计算文档的稳定标识
+        
+        两路检索返回的是不同的 Document 对象，不能用 id(doc) 判断是否为同一文档，
+        这里使用内容哈希，使相同内容的文档能够正确合并分数
+        
+        Args:
+            doc: 文档
+            
+        Returns:
+            文档内容的哈希值
+        """
+        return hashlib.blake2b(
+            doc.page_content.encode("utf-8"),
+            digest_size=16
+        ).digest()
     
     def _normalize_scores(
         self,
@@ -261,20 +323,18 @@ class HybridRetriever(BaseRetriever):
         if not results:
             return []
         
-        scores = [score for _, score in results]
-        min_score = min(scores)
-        max_score = max(scores)
+        docs, scores = zip(*results)
+        scores = np.asarray(scores, dtype=np.float64)
+        min_score = scores.min()
+        max_score = scores.max()
         
         # 避免除以零
         if max_score == min_score:
-            return [(doc, 1.0) for doc, _ in results]
+            return [(doc, 1.0) for doc in docs]
         
-        normalized = [
-            (doc, (score - min_score) / (max_score - min_score))
-            for doc, score in results
-        ]
+        normalized = (scores - min_score) / (max_score - min_score)
         
-        return normalized
+        return list(zip(docs, normalized.tolist()))
     
     def retrieve(
         self,
@@ -299,35 +359,48 @@ class HybridRetriever(BaseRetriever):
         v_weight = vector_weight if vector_weight is not None else self.vector_weight
         k_weight = 1.0 - v_weight
         
-        # 执行向量检索
-        vector_results = self.vector_retriever.retrieve(
+        # 某一路权重为 0 时不影响排序，只执行另一路检索且无需多取候选
+        if k_weight <= 0:
+            return self._normalize_scores(
+                self.vector_retriever.retrieve(query=query, top_k=k, **kwargs)
+            )
+        if v_weight <= 0:
+            return self._normalize_scores(
+                self.keyword_retriever.retrieve(query=query, top_k=k, **kwargs)
+            )
+        
+        candidate_k = k * self.candidate_multiplier  # 获取更多结果以便合并
+        
+        # 并行执行向量检索和关键词检索，两者互不依赖：向量检索交给共享线程池，
+        # 关键词检索在当前线程执行
+        vector_future = _RETRIEVAL_EXECUTOR.submit(
+            self.vector_retriever.retrieve,
             query=query,
-            top_k=k * 2,  # 获取更多结果以便合并
+            top_k=candidate_k,
             **kwargs
         )
-        
-        # 执行关键词检索
         keyword_results = self.keyword_retriever.retrieve(
             query=query,
-            top_k=k * 2,
+            top_k=candidate_k,
             **kwargs
         )
+        vector_results = vector_future.result()
         
         # 归一化分数
         vector_results = self._normalize_scores(vector_results)
         keyword_results = self._normalize_scores(keyword_results)
         
         # 合并结果
-        doc_scores: Dict[str, Tuple[Document, float]] = {}
+        doc_scores: Dict[bytes, Tuple[Document, float]] = {}
         
         # 添加向量检索结果
         for doc, score in vector_results:
-            doc_id = id(doc)
+            doc_id = self._doc_key(doc)
             doc_scores[doc_id] = (doc, score * v_weight)
         
         # 添加关键词检索结果
         for doc, score in keyword_results:
-            doc_id = id(doc)
+            doc_id = self._doc_key(doc)
             if doc_id in doc_scores:
                 # 文档已存在，累加分数
                 existing_doc, existing_score = doc_scores[doc_id]
@@ -335,12 +408,12 @@ class HybridRetriever(BaseRetriever):
             else:
                 doc_scores[doc_id] = (doc, score * k_weight)
         
-        # 按分数排序并返回 top-k
-        sorted_results = sorted(
+        # 只取 top-k，用堆选择代替全量排序
+        sorted_results = heapq.nlargest(
+            k,
             doc_scores.values(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:k]
+            key=lambda x: x[1]
+        )
         
         return sorted_results
     
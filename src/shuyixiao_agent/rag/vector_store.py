@@ -4,8 +4,10 @@
 提供向量数据库的统一接口，支持 ChromaDB
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+import itertools
 import os
+import uuid
 from pathlib import Path
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -15,6 +17,12 @@ from langchain_core.documents import Document
 from .embeddings import EmbeddingManager
 from ..config import settings
 
+# 单次写入向量库的文档数量上限
+ADD_BATCH_SIZE = 1024
+
+# 超过该数量时使用多进程嵌入
+BULK_EMBED_THRESHOLD = 5000
+
 
 class VectorStoreManager:
     """
@@ -89,7 +97,8 @@ class VectorStoreManager:
     def add_documents(
         self,
         documents: List[Document],
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        batch_size: int = ADD_BATCH_SIZE
     ) -> List[str]:
         """
         添加文档到向量存储
@@ -97,6 +106,7 @@ class VectorStoreManager:
         Args:
             documents: 文档列表
             ids: 文档 ID 列表
+            batch_size: 每批写入的文档数量
             
         Returns:
             文档 ID 列表
@@ -104,11 +114,65 @@ class VectorStoreManager:
         if not documents:
             return []
         
-        # 使用 Langchain 的 add_documents 方法
-        doc_ids = self.vectorstore.add_documents(
-            documents=documents,
-            ids=ids
-        )
+        # 大规模导入且使用本地模型时，先多进程并行嵌入再直接写入集合
+        if (
+            len(documents) > BULK_EMBED_THRESHOLD
+            and isinstance(self.embedding_manager, EmbeddingManager)
+        ):
+            return self._add_documents_bulk(documents, ids, batch_size)
+        
+        # 分批写入，避免一次性嵌入全部文档导致内存峰值过高
+        doc_ids = []
+        total = len(documents)
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            
+            # 使用 Langchain 的 add_documents 方法
+            doc_ids.extend(self.vectorstore.add_documents(
+                documents=documents[start:end],
+                ids=ids[start:end] if ids else None
+            ))
+            
+            if total > batch_size:
+                print(f"  已写入 {end}/{total} 个文档")
+        
+        print(f"已添加 {len(documents)} 个文档到集合 {self.collection_name}")
+        return doc_ids
+    
+    def _add_documents_bulk(
+        self,
+        documents: List[Document],
+        ids: Optional[List[str]],
+        batch_size: int
+    ) -> List[str]:
+        """
+        多进程嵌入后批量写入文档
+        
+        Args:
+            documents: 文档列表
+            ids: 文档 ID 列表
+            batch_size: 每批写入的文档数量
+            
+        Returns:
+            文档 ID 列表
+        """
+        texts = [doc.page_content for doc in documents]
+        doc_ids = ids or [str(uuid.uuid4()) for _ in documents]
+        
+        print(f"正在多进程嵌入 {len(texts)} 个文档...")
+        embeddings = self.embedding_manager.encode_bulk(texts)
+        
+        total = len(documents)
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            self.collection.upsert(
+                ids=doc_ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=texts[start:end],
+                # ChromaDB 不接受空字典作为元数据
+                metadatas=[doc.metadata or None for doc in documents[start:end]]
+            )
+            print(f"  已写入 {end}/{total} 个文档")
         
         print(f"已添加 {len(documents)} 个文档到集合 {self.collection_name}")
         return doc_ids
@@ -117,7 +181,8 @@ class VectorStoreManager:
         self,
         texts: List[str],
         metadatas: Optional[List[Dict[str, Any]]] = None,
-        ids: Optional[List[str]] = None
+        ids: Optional[List[str]] = None,
+        batch_size: int = ADD_BATCH_SIZE
     ) -> List[str]:
         """
         添加文本到向量存储
@@ -126,6 +191,7 @@ class VectorStoreManager:
             texts: 文本列表
             metadatas: 元数据列表
             ids: 文档 ID 列表
+            batch_size: 每批写入的文本数量
             
         Returns:
             文档 ID 列表
@@ -133,11 +199,19 @@ class VectorStoreManager:
         if not texts:
             return []
         
-        doc_ids = self.vectorstore.add_texts(
-            texts=texts,
-            metadatas=metadatas,
-            ids=ids
-        )
+        # 分批写入，避免一次性嵌入全部文本导致内存峰值过高
+        doc_ids = []
+        total = len(texts)
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            doc_ids.extend(self.vectorstore.add_texts(
+                texts=texts[start:end],
+                metadatas=metadatas[start:end] if metadatas else None,
+                ids=ids[start:end] if ids else None
+            ))
+            
+            if total > batch_size:
+                print(f"  已写入 {end}/{total} 个文本")
         
         print(f"已添加 {len(texts)} 个文本到集合 {self.collection_name}")
         return doc_ids
@@ -209,42 +283,69 @@ class VectorStoreManager:
         """获取文档数量"""
         return self.collection.count()
     
-    def list_documents(
+    def iter_documents(
         self,
-        limit: Optional[int] = None,
-        offset: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+        page_size: int = 500,
+        offset: int = 0
+    ) -> Iterator[Dict[str, Any]]:
         """
-        列出集合中的文档
+        分页遍历集合中的文档
+        
+        每次只从 ChromaDB 取出一页数据，内存占用与集合大小无关
         
         Args:
-            limit: 返回文档数量限制
-            offset: 偏移量
+            page_size: 每页读取的文档数量
+            offset: 起始偏移量
             
-        Returns:
-            文档列表，每个文档包含 id, text, metadata
+        Yields:
+            文档信息字典，包含 id, text, metadata
         """
-        try:
-            # 获取所有文档
+        while True:
             results = self.collection.get(
-                limit=limit,
+                limit=page_size,
                 offset=offset,
                 include=['documents', 'metadatas']
             )
             
-            documents = []
             ids = results.get('ids', [])
-            texts = results.get('documents', [])
-            metadatas = results.get('metadatas', [])
+            if not ids:
+                return
+            
+            texts = results.get('documents') or []
+            metadatas = results.get('metadatas') or []
             
             for i, doc_id in enumerate(ids):
-                documents.append({
+                yield {
                     'id': doc_id,
                     'text': texts[i] if i < len(texts) else '',
                     'metadata': metadatas[i] if i < len(metadatas) else {}
-                })
+                }
             
-            return documents
+            if len(ids) < page_size:
+                return
+            offset += len(ids)
+    
+    def list_documents(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        列出集合中的文档
+        
+        Args:
+            limit: 返回文档数量限制
+            offset: 偏移量
+            
+        Returns:
+            文档列表，每个文档包含 id, text, metadata
+        """
+        try:
+            page_size = min(limit, 500) if limit else 500
+            return list(itertools.islice(
+                self.iter_documents(page_size=page_size, offset=offset or 0),
+                limit
+            ))
         except Exception as e:
             print(f"列出文档时出错: {e}")
             return []
@@ -0,0 +1,89 @@
+"""
+聊天响应缓存
+
+对 /api/chat 做旁路缓存（look-aside）：相同的 (agent_type, system_message, message)
+在过期时间内直接返回 Redis 中保存的回复，不再调用大模型。
+只在配置了 REDIS_URL 时启用；Redis 出错时只打印警告，不影响正常对话。
+"""
+
+import hashlib
+from typing import Optional
+
+from .config import settings
+
+
+class RedisResponseCache:
+    """基于 Redis 的聊天响应缓存"""
+
+    def __init__(self, redis_url: str, ttl: int):
+        """
+        初始化响应缓存
+
+        Args:
+            redis_url: Redis 连接地址，如 redis://localhost:6379/0
+            ttl: 缓存过期时间（秒）
+        """
+        # 仅在配置了 Redis 时才需要 redis 包
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(agent_type: str, system_message: Optional[str], message: str) -> str:
+        """
+        计算缓存键，用固定长度的摘要避免长消息直接作为键
+
+        Args:
+            agent_type: Agent 类型
+            system_message: 系统消息
+            message: 用户消息
+
+        Returns:
+            Redis 键，格式为 resp:{摘要}
+        """
+        raw = f"{agent_type}|{system_message or ''}|{message}".encode("utf-8")
+        return "resp:" + hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        读取缓存的回复
+
+        Args:
+            key: 缓存键
+
+        Returns:
+            缓存的回复，未命中或 Redis 出错时返回 None
+        """
+        try:
+            cached = await self._redis.get(key)
+        except Exception as e:
+            print(f"[警告] 读取响应缓存失败: {str(e)}")
+            return None
+        return cached.decode("utf-8") if cached is not None else None
+
+    async def set(self, key: str, response: str) -> None:
+        """
+        写入回复并设置过期时间
+
+        Args:
+            key: 缓存键
+            response: 回复内容
+        """
+        try:
+            await self._redis.setex(key, self.ttl, response.encode("utf-8"))
+        except Exception as e:
+            print(f"[警告] 写入响应缓存失败: {str(e)}")
+
+
+def create_response_cache() -> Optional[RedisResponseCache]:
+    """
+    根据配置创建响应缓存
+
+    Returns:
+        配置了 redis_url 且 response_cache_ttl > 0 时返回 RedisResponseCache，否则返回 None
+    """
+    if settings.redis_url and settings.response_cache_ttl > 0:
+        print(f"[信息] /api/chat 响应缓存已启用 (过期时间 {settings.response_cache_ttl} 秒)")
+        return RedisResponseCache(settings.redis_url, ttl=settings.response_cache_ttl)
+    return None
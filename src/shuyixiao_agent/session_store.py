@@ -0,0 +1,185 @@
+"""
+会话历史存储
+
+为 Web 聊天接口保存每个会话的消息历史：
+- 未配置 REDIS_URL 时保存在进程内存中（单机开发）
+- 配置 REDIS_URL 后保存在 Redis 中，多个 worker/实例共享同一份历史
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List
+
+import orjson
+
+from .config import settings
+
+
+class InMemorySessionStore:
+    """
+    进程内会话历史存储
+
+    每个会话是一个 deque(maxlen=max_messages)，追加为 O(1)，超出上限时
+    自动丢弃最早的消息，与 RedisSessionStore 的 LTRIM 行为一致。
+    """
+
+    def __init__(self, max_messages: int = 50):
+        """
+        初始化进程内会话历史存储
+
+        Args:
+            max_messages: 每个会话最多保留的消息条数
+        """
+        self.max_messages = max_messages
+        self._histories: Dict[str, Deque[Dict[str, str]]] = {}
+
+    async def append(self, session_id: str, message: Dict[str, str]) -> None:
+        """
+        追加一条消息
+
+        Args:
+            session_id: 会话 ID
+            message: 消息字典，格式为 {"role": "...", "content": "..."}
+        """
+        history = self._histories.get(session_id)
+        if history is None:
+            history = self._histories[session_id] = deque(maxlen=self.max_messages)
+        history.append(message)
+
+    async def recent(self, session_id: str, count: int) -> List[Dict[str, str]]:
+        """
+        获取最近的若干条消息
+
+        Args:
+            session_id: 会话 ID
+            count: 消息条数
+
+        Returns:
+            按时间顺序排列的消息列表
+        """
+        history = self._histories.get(session_id)
+        if not history:
+            return []
+        # deque 不支持切片，跳过前面的消息只复制最后 count 条
+        return list(islice(history, max(len(history) - count, 0), None))
+
+    async def get(self, session_id: str) -> List[Dict[str, str]]:
+        """
+        获取会话的全部消息
+
+        Args:
+            session_id: 会话 ID
+
+        Returns:
+            按时间顺序排列的消息列表
+        """
+        return list(self._histories.get(session_id, []))
+
+    async def clear(self, session_id: str) -> None:
+        """
+        清除会话历史
+
+        Args:
+            session_id: 会话 ID
+        """
+        self._histories.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """
+    基于 Redis 的会话历史存储
+
+    每个会话是一个 Redis LIST（键为 session:{id}），追加消息后用 LTRIM 只保留
+    最近 max_messages 条，并刷新 EXPIRE，长时间不活跃的会话自动过期。
+    """
+
+    def __init__(self, redis_url: str, max_messages: int, ttl: int):
+        """
+        初始化 Redis 会话历史存储
+
+        Args:
+            redis_url: Redis 连接地址，如 redis://localhost:6379/0
+            max_messages: 每个会话最多保留的消息条数
+            ttl: 会话过期时间（秒）
+        """
+        # 仅在配置了 Redis 时才需要 redis 包
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(redis_url)
+        self.max_messages = max_messages
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        """会话对应的 Redis 键"""
+        return f"session:{session_id}"
+
+    async def append(self, session_id: str, message: Dict[str, str]) -> None:
+        """
+        追加一条消息，并裁剪长度、刷新过期时间
+
+        Args:
+            session_id: 会话 ID
+            message: 消息字典，格式为 {"role": "...", "content": "..."}
+        """
+        key = self._key(session_id)
+        # 三条命令放在同一个 pipeline 中，只需一次网络往返
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.rpush(key, orjson.dumps(message))
+            pipe.ltrim(key, -self.max_messages, -1)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+    async def recent(self, session_id: str, count: int) -> List[Dict[str, str]]:
+        """
+        获取最近的若干条消息
+
+        Args:
+            session_id: 会话 ID
+            count: 消息条数
+
+        Returns:
+            按时间顺序排列的消息列表
+        """
+        items = await self._redis.lrange(self._key(session_id), -count, -1)
+        return [orjson.loads(item) for item in items]
+
+    async def get(self, session_id: str) -> List[Dict[str, str]]:
+        """
+        获取会话的全部消息
+
+        Args:
+            session_id: 会话 ID
+
+        Returns:
+            按时间顺序排列的消息列表
+        """
+        items = await self._redis.lrange(self._key(session_id), 0, -1)
+        return [orjson.loads(item) for item in items]
+
+    async def clear(self, session_id: str) -> None:
+        """
+        清除会话历史
+
+        Args:
+            session_id: 会话 ID
+        """
+        await self._redis.delete(self._key(session_id))
+
+
+def create_session_store():
+    """
+    根据配置创建会话历史存储
+
+    Returns:
+        配置了 redis_url 时返回 RedisSessionStore，否则返回 InMemorySessionStore
+    """
+    if settings.redis_url:
+        print(f"[信息] 会话历史使用 Redis 存储 (最多 {settings.session_history_max_messages} 条, "
+              f"过期时间 {settings.session_history_ttl} 秒)")
+        return RedisSessionStore(
+            settings.redis_url,
+            max_messages=settings.session_history_max_messages,
+            ttl=settings.session_history_ttl
+        )
+    return InMemorySessionStore(max_messages=settings.session_history_max_messages)
@@ -9,6 +9,7 @@ from .basic_tools import (
     calculate, 
     search_wikipedia,
     get_random_number,
+    get_random_numbers,
     convert_temperature,
     string_reverse,
     count_words,
@@ -18,11 +19,15 @@ from .basic_tools import (
     encode_base64,
     decode_base64,
     check_prime,
-    get_basic_tools
+    encode_base64_many,
+    check_prime_many,
+    get_basic_tools,
+    get_tool_definitions_json
 )
 
 from .ai_powered_tools import (
     web_content_analyzer,
+    web_content_analyzer_batch,
     text_quality_analyzer,
     creative_idea_generator,
     code_review_assistant,
@@ -32,7 +37,11 @@ from .ai_powered_tools import (
     problem_solver,
     meeting_summarizer,
     learning_path_designer,
-    get_ai_powered_tools
+    get_ai_powered_tools,
+    clear_ai_tool_cache,
+    batch_invoke,
+    split_batch_response,
+    ToolResult
 )
 
 __all__ = [
@@ -41,6 +50,7 @@ __all__ = [
     "calculate", 
     "search_wikipedia",
     "get_random_number",
+    "get_random_numbers",
     "convert_temperature",
     "string_reverse",
     "count_words",
@@ -50,10 +60,14 @@ __all__ = [
     "encode_base64",
     "decode_base64",
     "check_prime",
+    "encode_base64_many",
+    "check_prime_many",
     "get_basic_tools",
+    "get_tool_definitions_json",
     
     # AI驱动的智能工具（需要大模型参与）
     "web_content_analyzer",
+    "web_content_analyzer_batch",
     "text_quality_analyzer",
     "creative_idea_generator",
     "code_review_assistant",
@@ -63,6 +77,10 @@ __all__ = [
     "problem_solver",
     "meeting_summarizer",
     "learning_path_designer",
-    "get_ai_powered_tools"
+    "get_ai_powered_tools",
+    "clear_ai_tool_cache",
+    "batch_invoke",
+    "split_batch_response",
+    "ToolResult"
 ]
 
@@ -5,15 +5,492 @@ AI驱动的智能工具集
 而不是简单的硬编码逻辑。
 """
 
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
-import json
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, fields
+from collections import OrderedDict
+import asyncio
+import codecs
+import functools
 import re
+import threading
+import time
 from datetime import datetime
+from email.message import Message
 
+# 需要提取文本的网页元素
+_PARAGRAPH_TAGS = ['p', 'h1', 'h2', 'h3', 'article']
+_PARAGRAPH_XPATH = '|'.join(f'//{tag}' for tag in _PARAGRAPH_TAGS)
 
-def web_content_analyzer(url: str, analysis_type: str = "summary") -> Dict:
+# 网页抓取请求头
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# 网页抓取的最大字节数
+_MAX_PAGE_BYTES = 512 * 1024
+
+# 网页 meta 标签声明的字符集，只在页面开头查找
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+
+# 网页段落的最小长度，更短的段落视为导航、按钮等噪声
+_MIN_PARA_LEN = 20
+
+# 网络请求和网页解析依赖只有 web_content_analyzer 使用，首次调用时才导入，
+# 避免只使用其他工具时承担 requests、bs4、lxml 的导入时间和内存
+_SESSION = None
+_LXML_HTML = None
+_LAZY_IMPORT_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    获取模块级 HTTP 会话，首次调用时创建
+    
+    复用连接池避免每次请求重新建立 TCP/TLS 连接。
+    
+    Returns:
+        requests.Session
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _LAZY_IMPORT_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=20,
+                    pool_maxsize=50,
+                    max_retries=Retry(total=2, backoff_factor=0.3)
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _get_lxml_html():
+    """
+    获取 lxml.html 模块，首次调用时导入
+    
+    Returns:
+        lxml.html 模块，未安装 lxml 时返回 None
+    """
+    global _LXML_HTML
+    if _LXML_HTML is None:
+        try:
+            from lxml import html as lxml_html
+        except ImportError:
+            lxml_html = False
+        _LXML_HTML = lxml_html
+    return _LXML_HTML or None
+
+
+class _ToolResultCache:
+    """
+    AI 工具网页缓存
+    
+    按键精确匹配，超过容量时淘汰最久未使用的条目，条目超过 TTL 后失效
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 3600):
+        """
+        初始化缓存
+        
+        Args:
+            maxsize: 最大缓存条目数
+            ttl: 条目有效期（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def put(self, key: str, value: tuple) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# 网页条件请求缓存：URL -> (ETag, Last-Modified, 标题, 段落列表)
+_PAGE_CACHE = _ToolResultCache(maxsize=256, ttl=24 * 3600)
+
+
+class LazyPrompt:
+    """
+    延迟生成的提示词
+    
+    只在首次转换为字符串时才格式化模板，之后复用结果。调用方只读取元数据
+    （如 needs_ai_processing）时不会产生格式化开销。
+    """
+    
+    __slots__ = ('_factory', '_value')
+    
+    def __init__(self, factory: Callable[[], str]):
+        """
+        初始化延迟提示词
+        
+        Args:
+            factory: 生成提示词的无参函数
+        """
+        self._factory = factory
+        self._value = None
+    
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = self._factory()
+        return self._value
+    
+    def __repr__(self) -> str:
+        return repr(str(self))
+    
+    def __len__(self) -> int:
+        return len(str(self))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyPrompt):
+            other = str(other)
+        return str(self) == other
+    
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+class ToolResult:
+    """
+    AI 工具结果基类
+    
+    子类为 slots 冻结数据类，内存占用小于字典。同时支持字典式只读访问
+    （result["instruction"]、"error" in result、dict(result)），转换为字符串时与字典结果一致。
+    字典式访问得到的提示词是普通 str，与原来的字典结果一样可以拼接、json.dumps；
+    只有属性访问（result.instruction）保持延迟生成。
+    """
+    
+    __slots__ = ()
+    
+    def keys(self) -> List[str]:
+        return [field.name for field in fields(self)]
+    
+    def _field_value(self, key: str):
+        """读取字段值，延迟提示词渲染为 str"""
+        value = getattr(self, key)
+        return str(value) if isinstance(value, LazyPrompt) else value
+    
+    def __getitem__(self, key: str):
+        if key not in self.keys():
+            raise KeyError(key)
+        return self._field_value(key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+    
+    def get(self, key: str, default=None):
+        return self._field_value(key) if key in self.keys() else default
+    
+    def to_dict(self) -> Dict:
+        """转换为字典（浅拷贝）"""
+        return {name: self._field_value(name) for name in self.keys()}
+    
+    def __str__(self) -> str:
+        return str(self.to_dict())
+
+
+@dataclass(slots=True, frozen=True)
+class WebAnalysisResult(ToolResult):
+    """网页内容分析结果"""
+    url: str
+    title: str
+    raw_content: str
+    analysis_type: str
+    instruction: LazyPrompt
+    content_length: int
+    paragraph_count: int
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class TextQualityResult(ToolResult):
+    """文本质量分析结果"""
+    original_text: str
+    word_count: int
+    sentence_count: int
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class CreativeIdeaResult(ToolResult):
+    """创意想法生成结果"""
+    topic: str
+    idea_type: str
+    count: int
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class CodeReviewResult(ToolResult):
+    """代码审查结果"""
+    code: str
+    language: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class DecisionAnalysisResult(ToolResult):
+    """决策分析结果"""
+    situation: str
+    options: List[str]
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class DataInsightResult(ToolResult):
+    """数据洞察结果"""
+    data_description: str
+    data_sample: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class ContentImprovementResult(ToolResult):
+    """内容优化结果"""
+    original_content: str
+    improvement_type: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class ProblemSolvingResult(ToolResult):
+    """问题解决结果"""
+    problem: str
+    context: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class MeetingSummaryResult(ToolResult):
+    """会议总结结果"""
+    meeting_notes: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class LearningPathResult(ToolResult):
+    """学习路径设计结果"""
+    topic: str
+    current_level: str
+    goal: str
+    instruction: LazyPrompt
+    needs_ai_processing: bool = True
+
+
+def clear_ai_tool_cache():
+    """清空 AI 工具的网页缓存"""
+    _PAGE_CACHE.clear()
+
+
+def _detect_page_encoding(html: bytes, response_headers) -> Optional[str]:
+    """
+    确定网页的字符编码
+    
+    优先使用响应头 Content-Type 声明的字符集；响应头没有声明时，页面开头有
+    meta 字符集声明则交给解析器识别，否则能按 UTF-8 解码的页面视为 UTF-8。
+    
+    Args:
+        html: 网页原始字节
+        response_headers: 响应头
+        
+    Returns:
+        编码名称，返回 None 时由解析器自行识别
+    """
+    message = Message()
+    message['Content-Type'] = response_headers.get('Content-Type', '')
+    charset = message.get_content_charset()
+    if charset:
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            pass
+    
+    if _META_CHARSET_RE.search(html, 0, 2048):
+        return None
+    
+    # 页面按最大字节数截断，末尾可能是不完整的多字节字符，用增量解码器忽略
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(html, final=False)
+    except UnicodeDecodeError:
+        return None
+    return 'utf-8'
+
+
+def _extract_page_text(html: bytes, encoding: Optional[str] = None) -> Tuple[str, List[str]]:
+    """
+    提取网页标题和段落文本
+    
+    安装了 lxml 时用一条 XPath 完成段落提取，否则回退到 BeautifulSoup。
+    传入原始字节，未指定编码时由解析器根据 meta 标签识别编码。
+    
+    Args:
+        html: 网页原始字节
+        encoding: 网页编码，None 表示由解析器识别
+        
+    Returns:
+        (标题, 段落文本列表)
+    """
+    # 优先使用基于 C 的 lxml 解析网页，未安装时回退到 BeautifulSoup 标准库解析器
+    lxml_html = _get_lxml_html()
+    if lxml_html is not None:
+        if not html.strip():
+            return "无标题", []
+        
+        parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+        tree = lxml_html.fromstring(html, parser=parser)
+        
+        # 移除script和style标签
+        for element in tree.xpath('//script|//style'):
+            element.drop_tree()
+        
+        title_element = tree.find('.//title')
+        title = title_element.text_content() if title_element is not None else "无标题"
+        texts = (
+            element.text_content().strip()
+            for element in tree.xpath(_PARAGRAPH_XPATH)
+        )
+    else:
+        from bs4 import BeautifulSoup
+        
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding)
+        
+        # 移除script和style标签
+        for element in soup(["script", "style"]):
+            element.decompose()
+        
+        title_element = soup.find('title')
+        title = title_element.text if title_element else "无标题"
+        texts = (
+            element.get_text(strip=True)
+            for element in soup.find_all(_PARAGRAPH_TAGS)
+        )
+    
+    # 过滤太短的段落
+    paragraphs = [text for text in texts if len(text) > _MIN_PARA_LEN]
+    return title, paragraphs
+
+
+_WEB_CONTENT_TEMPLATE = "请对给定网页内容进行分析。\n\n分析类型：{analysis_type}\n\n标题：{title}\n\n内容：\n{content}"
+
+
+def _conditional_headers(url: str) -> Tuple[Dict, Optional[tuple]]:
+    """
+    生成网页抓取请求头，之前抓取过的页面附带条件请求头
+    
+    Args:
+        url: 网页URL
+        
+    Returns:
+        (请求头, 缓存的页面条目或None)
+    """
+    cached_page = _PAGE_CACHE.get(url)
+    if cached_page is None:
+        return _HEADERS, None
+    
+    etag, last_modified = cached_page[:2]
+    headers = dict(_HEADERS)
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers, cached_page
+
+
+def _parse_page(url: str, html: Optional[bytes], response_headers, cached_page: Optional[tuple]) -> Tuple[str, List[str]]:
+    """
+    解析网页内容，未修改（html 为 None）时复用缓存的解析结果
+    
+    Args:
+        url: 网页URL
+        html: 网页原始字节，服务端返回 304 时为 None
+        response_headers: 响应头
+        cached_page: 缓存的页面条目
+        
+    Returns:
+        (标题, 段落文本列表)
+    """
+    if html is None:
+        return cached_page[2:]
+    
+    # 提取主要内容
+    title, paragraphs = _extract_page_text(
+        html, _detect_page_encoding(html, response_headers)
+    )
+    etag = response_headers.get('ETag')
+    last_modified = response_headers.get('Last-Modified')
+    if etag or last_modified:
+        _PAGE_CACHE.put(url, (etag, last_modified, title, paragraphs))
+    return title, paragraphs
+
+
+def _build_web_result(url: str, analysis_type: str, title: str, paragraphs: List[str]) -> WebAnalysisResult:
+    """
+    根据解析出的网页内容构建分析结果
+    
+    Args:
+        url: 网页URL
+        analysis_type: 分析类型
+        title: 网页标题
+        paragraphs: 段落文本列表
+        
+    Returns:
+        网页分析结果
+    """
+    content = "\n".join(paragraphs[:50])  # 限制内容长度
+    
+    # 返回原始内容，让AI进行智能分析
+    return WebAnalysisResult(
+        url=url,
+        title=title,
+        raw_content=content[:3000],  # 限制长度
+        analysis_type=analysis_type,
+        instruction=LazyPrompt(functools.partial(
+            _WEB_CONTENT_TEMPLATE.format,
+            analysis_type=analysis_type,
+            title=title,
+            content=content[:2000]
+        )),
+        content_length=len(content),
+        paragraph_count=len(paragraphs)
+    )
+
+
+# 未修改的页面由 _PAGE_CACHE 的 ETag/Last-Modified 重新验证后复用解析结果
+def web_content_analyzer(url: str, analysis_type: str = "summary") -> Union[WebAnalysisResult, Dict]:
     """
     智能网页内容分析器
     
@@ -27,43 +504,58 @@ def web_content_analyzer(url: str, analysis_type: str = "summary") -> Dict:
         analysis_type: 分析类型 (summary/keywords/sentiment/structure)
         
     Returns:
-        包含分析结果的字典，需要AI进一步处理原始内容
+        网页分析结果（失败时为包含 error 的字典），需要AI进一步处理原始内容
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.encoding = response.apparent_encoding
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 之前抓取过的页面发送条件请求，未修改时服务端返回 304，无需重新下载和解析
+        headers, cached_page = _conditional_headers(url)
         
-        # 移除script和style标签
-        for script in soup(["script", "style"]):
-            script.decompose()
+        # 流式读取并限制大小，只需要页面前部的内容，无需缓冲整个响应
+        with _get_session().get(url, headers=headers, timeout=(3, 10), stream=True) as response:
+            if response.status_code == 304 and cached_page is not None:
+                html = None
+            else:
+                html = response.raw.read(_MAX_PAGE_BYTES, decode_content=True)
         
-        # 提取主要内容
-        title = soup.find('title').text if soup.find('title') else "无标题"
+        title, paragraphs = _parse_page(url, html, response.headers, cached_page)
+        return _build_web_result(url, analysis_type, title, paragraphs)
+    except Exception as e:
+        return {
+            "error": f"抓取失败: {str(e)}",
+            "needs_ai_processing": False
+        }
+
+
+async def _fetch_page_async(client, url: str, analysis_type: str) -> Union[WebAnalysisResult, Dict]:
+    """
+    异步抓取并分析单个网页
+    
+    Args:
+        client: httpx.AsyncClient
+        url: 网页URL
+        analysis_type: 分析类型
         
-        # 提取所有段落文本
-        paragraphs = []
-        for p in soup.find_all(['p', 'h1', 'h2', 'h3', 'article']):
-            text = p.get_text(strip=True)
-            if len(text) > 20:  # 过滤太短的段落
-                paragraphs.append(text)
+    Returns:
+        网页分析结果（失败时为包含 error 的字典）
+    """
+    try:
+        headers, cached_page = _conditional_headers(url)
         
-        content = "\n".join(paragraphs[:50])  # 限制内容长度
+        async with client.stream('GET', url, headers=headers) as response:
+            if response.status_code == 304 and cached_page is not None:
+                html = None
+            else:
+                chunks = []
+                size = 0
+                async for chunk in response.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= _MAX_PAGE_BYTES:
+                        break
+                html = b"".join(chunks)[:_MAX_PAGE_BYTES]
         
-        # 返回原始内容，让AI进行智能分析
-        return {
-            "url": url,
-            "title": title,
-            "raw_content": content[:3000],  # 限制长度
-            "analysis_type": analysis_type,
-            "instruction": f"请对以下网页内容进行{analysis_type}分析：\n\n标题：{title}\n\n内容：\n{content[:2000]}",
-            "content_length": len(content),
-            "paragraph_count": len(paragraphs),
-            "needs_ai_processing": True
-        }
+        title, paragraphs = _parse_page(url, html, response.headers, cached_page)
+        return _build_web_result(url, analysis_type, title, paragraphs)
     except Exception as e:
         return {
             "error": f"抓取失败: {str(e)}",
@@ -71,7 +563,176 @@ def web_content_analyzer(url: str, analysis_type: str = "summary") -> Dict:
         }
 
 
-def text_quality_analyzer(text: str) -> Dict:
+async def web_content_analyzer_batch(urls: List[str], analysis_type: str = "summary") -> List[Union[WebAnalysisResult, Dict]]:
+    """
+    并发抓取并分析多个网页
+    
+    所有请求共享一个支持 HTTP/2 的连接池并发执行，总耗时约为最慢的单个请求。
+    
+    Args:
+        urls: 要分析的网页URL列表
+        analysis_type: 分析类型 (summary/keywords/sentiment/structure)
+        
+    Returns:
+        与 urls 顺序一致的分析结果列表
+    """
+    import httpx
+    
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=_HEADERS,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        follow_redirects=True
+    ) as client:
+        return await asyncio.gather(
+            *(_fetch_page_async(client, url, analysis_type) for url in urls)
+        )
+
+
+# 匹配一个非空句子：以非空白字符开头，直到中英文句子结束符为止
+_SENTENCE_RE = re.compile(r'[^.!?。！？\s][^.!?。！？]*')
+
+
+def _scan_text_stats(buf) -> Tuple[int, int]:
+    """
+    单次扫描 UTF-8 字节统计单词数和句子数
+    
+    空白字符与 str.split() / 正则 \\s 相同（str.isspace() 为真的全部字符：ASCII 空白、
+    U+001C~U+001F、U+0085、U+00A0、U+1680、U+2000~U+200A、U+2028、U+2029、
+    U+202F、U+205F、U+3000），句子结束符为 . ! ? 。 ！ ？，仅包含空白的句子不计数。
+    
+    Args:
+        buf: 文本的 UTF-8 字节数组（numpy uint8）
+        
+    Returns:
+        (单词数, 句子数)
+    """
+    n = buf.shape[0]
+    word_count = 0
+    sentence_count = 0
+    in_word = False
+    has_content = False
+    i = 0
+    while i < n:
+        b = buf[i]
+        width = 1
+        is_space = False
+        is_terminator = False
+        if b == 46 or b == 33 or b == 63:
+            is_terminator = True
+        elif b == 32 or 9 <= b <= 13 or 28 <= b <= 31:
+            is_space = True
+        elif b == 0xC2 and i + 1 < n and (buf[i + 1] == 0xA0 or buf[i + 1] == 0x85):
+            is_space = True
+            width = 2
+        elif b == 0xE1 and i + 2 < n and buf[i + 1] == 0x9A and buf[i + 2] == 0x80:
+            is_space = True
+            width = 3
+        elif b == 0xE2 and i + 2 < n and buf[i + 1] == 0x80 and (
+            0x80 <= buf[i + 2] <= 0x8A or buf[i + 2] == 0xA8 or buf[i + 2] == 0xA9 or buf[i + 2] == 0xAF
+        ):
+            is_space = True
+            width = 3
+        elif b == 0xE2 and i + 2 < n and buf[i + 1] == 0x81 and buf[i + 2] == 0x9F:
+            is_space = True
+            width = 3
+        elif b == 0xE3 and i + 2 < n and buf[i + 1] == 0x80 and (buf[i + 2] == 0x80 or buf[i + 2] == 0x82):
+            if buf[i + 2] == 0x80:
+                is_space = True
+            else:
+                is_terminator = True
+            width = 3
+        elif b == 0xEF and i + 2 < n and buf[i + 1] == 0xBC and (buf[i + 2] == 0x81 or buf[i + 2] == 0x9F):
+            is_terminator = True
+            width = 3
+        
+        if is_space:
+            in_word = False
+        else:
+            if not in_word:
+                word_count += 1
+                in_word = True
+            if is_terminator:
+                if has_content:
+                    sentence_count += 1
+                has_content = False
+            else:
+                has_content = True
+        i += width
+    
+    if has_content:
+        sentence_count += 1
+    return word_count, sentence_count
+
+
+# 超过该长度的文本才使用 numba 扫描，短文本用 str.split 更快，也不必触发 JIT 编译
+_JIT_MIN_CHARS = 10000
+
+# 可选的 numba JIT 加速文本统计，首次遇到长文本时才导入 numba 并编译（cache=True 时编译结果
+# 写入磁盘缓存，之后的进程直接加载），导入模块和只处理短文本的进程不承担导入和编译开销。
+# None 表示尚未初始化，False 表示未安装 numba
+_scan_text_stats_jit = None
+
+
+def _get_scan_text_stats_jit():
+    """
+    获取 JIT 编译后的 _scan_text_stats，首次调用时导入 numba 并编译
+    
+    Returns:
+        编译后的函数，未安装 numba 时返回 None
+    """
+    global _scan_text_stats_jit
+    if _scan_text_stats_jit is not None:
+        return _scan_text_stats_jit or None
+    
+    try:
+        from numba import njit
+    except ImportError:
+        _scan_text_stats_jit = False
+        return None
+    
+    _scan_text_stats_jit = njit(cache=True)(_scan_text_stats)
+    return _scan_text_stats_jit
+
+
+def _text_stats(text: str) -> Tuple[int, int]:
+    """
+    统计文本的单词数和句子数
+    
+    两种实现使用相同的空白字符和句子结束符，结果与是否安装 numba 无关。
+    
+    Args:
+        text: 文本内容
+        
+    Returns:
+        (单词数, 句子数)
+    """
+    scan = _get_scan_text_stats_jit() if len(text) >= _JIT_MIN_CHARS else None
+    if scan is not None:
+        import numpy as np
+        return scan(np.frombuffer(text.encode('utf-8'), dtype=np.uint8))
+    
+    word_count = len(text.split())
+    sentence_count = sum(1 for _ in _SENTENCE_RE.finditer(text))
+    return word_count, sentence_count
+
+
+_TEXT_QUALITY_TEMPLATE = """请作为专业的文本编辑，分析给定文本的质量并提供改进建议。
+
+请从以下几个维度分析：
+1. 语言表达：是否流畅、准确、简洁
+2. 逻辑结构：是否清晰、连贯、有条理
+3. 语法错误：是否存在语法、标点、用词问题
+4. 改进建议：具体的修改建议和改写示例
+
+请给出专业的分析报告。
+
+原文：
+{text}"""
+
+
+def text_quality_analyzer(text: str) -> TextQualityResult:
     """
     文本质量智能分析器
     
@@ -84,33 +745,38 @@ def text_quality_analyzer(text: str) -> Dict:
         text: 要分析的文本
         
     Returns:
-        包含原始文本的字典，需要AI进行质量分析
+        包含原始文本的结果，需要AI进行质量分析
     """
     # 基础统计（非AI部分）
-    word_count = len(text.split())
-    sentence_count = len([s for s in text.split('.') if s.strip()])
+    word_count, sentence_count = _text_stats(text)
     
-    return {
-        "original_text": text,
-        "word_count": word_count,
-        "sentence_count": sentence_count,
-        "instruction": f"""请作为专业的文本编辑，分析以下文本的质量并提供改进建议：
+    return TextQualityResult(
+        original_text=text,
+        word_count=word_count,
+        sentence_count=sentence_count,
+        instruction=LazyPrompt(functools.partial(
+            _TEXT_QUALITY_TEMPLATE.format,
+            text=text
+        ))
+    )
 
-原文：
-{text}
 
-请从以下几个维度分析：
-1. 语言表达：是否流畅、准确、简洁
-2. 逻辑结构：是否清晰、连贯、有条理
-3. 语法错误：是否存在语法、标点、用词问题
-4. 改进建议：具体的修改建议和改写示例
+_CREATIVE_IDEA_TEMPLATE = """请作为创意顾问，围绕给定主题生成有创意的想法。
 
-请给出专业的分析报告。""",
-        "needs_ai_processing": True
-    }
+要求：
+1. 每个创意都要具有创新性和可行性
+2. 提供具体的实施思路
+3. 说明创意的价值和优势
+4. 考虑实际应用场景
+
+请以结构化的方式呈现，包含创意标题、详细描述、实施要点和预期效果。
 
+**主题：**"{topic}"
+**创意类型：**{description}
+**生成数量：**{count}个"""
 
-def creative_idea_generator(topic: str, idea_type: str = "general", count: int = 5) -> Dict:
+
+def creative_idea_generator(topic: str, idea_type: str = "general", count: int = 5) -> CreativeIdeaResult:
     """
     创意想法生成器
     
@@ -125,7 +791,7 @@ def creative_idea_generator(topic: str, idea_type: str = "general", count: int =
         count: 生成数量
         
     Returns:
-        包含生成指令的字典
+        包含生成指令的结果
     """
     type_descriptions = {
         "business": "商业模式创意",
@@ -137,48 +803,18 @@ def creative_idea_generator(topic: str, idea_type: str = "general", count: int =
     
     description = type_descriptions.get(idea_type, "创意想法")
     
-    return {
-        "topic": topic,
-        "idea_type": idea_type,
-        "count": count,
-        "instruction": f"""请为"{topic}"主题生成{count}个有创意的{description}。
-
-要求：
-1. 每个创意都要具有创新性和可行性
-2. 提供具体的实施思路
-3. 说明创意的价值和优势
-4. 考虑实际应用场景
-
-请以结构化的方式呈现，包含创意标题、详细描述、实施要点和预期效果。""",
-        "needs_ai_processing": True
-    }
-
+    return CreativeIdeaResult(
+        topic=topic,
+        idea_type=idea_type,
+        count=count,
+        instruction=LazyPrompt(functools.partial(
+            _CREATIVE_IDEA_TEMPLATE.format,
+            topic=topic, description=description, count=count
+        ))
+    )
 
-def code_review_assistant(code: str, language: str = "python") -> Dict:
-    """
-    代码智能审查助手
-    
-    需要AI能力：
-    - 理解代码逻辑
-    - 发现潜在问题
-    - 提供优化建议
-    - 评估代码质量
-    
-    Args:
-        code: 要审查的代码
-        language: 编程语言
-        
-    Returns:
-        包含代码和审查指令的字典
-    """
-    return {
-        "code": code,
-        "language": language,
-        "instruction": f"""请作为资深工程师，对以下{language}代码进行专业的代码审查：
 
-```{language}
-{code}
-```
+_CODE_REVIEW_TEMPLATE = """请作为资深工程师，对给定代码进行专业的代码审查。
 
 请从以下维度进行审查：
 
@@ -202,39 +838,43 @@ def code_review_assistant(code: str, language: str = "python") -> Dict:
    - 具体的改进方案
    - 优化后的代码示例
 
-请给出详细的审查报告和改进建议。""",
-        "needs_ai_processing": True
-    }
+请给出详细的审查报告和改进建议。
+
+**待审查的{language}代码：**
 
+```{language}
+{code}
+```"""
 
-def decision_analyzer(situation: str, options: List[str]) -> Dict:
+
+def code_review_assistant(code: str, language: str = "python") -> CodeReviewResult:
     """
-    决策智能分析器
+    代码智能审查助手
     
     需要AI能力：
-    - 多角度分析问题
-    - 权衡利弊
-    - 提供理性建议
+    - 理解代码逻辑
+    - 发现潜在问题
+    - 提供优化建议
+    - 评估代码质量
     
     Args:
-        situation: 决策场景描述
-        options: 可选方案列表
+        code: 要审查的代码
+        language: 编程语言
         
     Returns:
-        包含决策分析指令的字典
+        包含代码和审查指令的结果
     """
-    options_text = "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(options)])
-    
-    return {
-        "situation": situation,
-        "options": options,
-        "instruction": f"""请作为决策顾问，帮助分析以下决策场景：
+    return CodeReviewResult(
+        code=code,
+        language=language,
+        instruction=LazyPrompt(functools.partial(
+            _CODE_REVIEW_TEMPLATE.format,
+            language=language, code=code
+        ))
+    )
 
-**场景描述：**
-{situation}
 
-**可选方案：**
-{options_text}
+_DECISION_TEMPLATE = """请作为决策顾问，帮助分析给定的决策场景。
 
 请提供专业的决策分析：
 
@@ -252,37 +892,44 @@ def decision_analyzer(situation: str, options: List[str]) -> Dict:
    - 实施建议
    - 注意事项
 
-请给出理性、全面的决策分析。""",
-        "needs_ai_processing": True
-    }
+请给出理性、全面的决策分析。
+
+**场景描述：**
+{situation}
+
+**可选方案：**
+{options_text}"""
 
 
-def data_insight_generator(data_description: str, data_sample: str) -> Dict:
+def decision_analyzer(situation: str, options: List[str]) -> DecisionAnalysisResult:
     """
-    数据洞察生成器
+    决策智能分析器
     
     需要AI能力：
-    - 理解数据含义
-    - 发现数据规律和趋势
-    - 提供有价值的洞察
+    - 多角度分析问题
+    - 权衡利弊
+    - 提供理性建议
     
     Args:
-        data_description: 数据描述
-        data_sample: 数据样本（文本形式）
+        situation: 决策场景描述
+        options: 可选方案列表
         
     Returns:
-        包含数据和分析指令的字典
+        包含决策分析指令的结果
     """
-    return {
-        "data_description": data_description,
-        "data_sample": data_sample,
-        "instruction": f"""请作为数据分析师，对以下数据进行深入分析：
+    options_text = "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(options)])
+    
+    return DecisionAnalysisResult(
+        situation=situation,
+        options=options,
+        instruction=LazyPrompt(functools.partial(
+            _DECISION_TEMPLATE.format,
+            situation=situation, options_text=options_text
+        ))
+    )
 
-**数据描述：**
-{data_description}
 
-**数据样本：**
-{data_sample}
+_DATA_INSIGHT_TEMPLATE = """请作为数据分析师，对给定数据进行深入分析。
 
 请提供数据洞察分析：
 
@@ -303,43 +950,42 @@ def data_insight_generator(data_description: str, data_sample: str) -> Dict:
    - 基于数据的决策建议
    - 需要关注的重点
 
-请提供专业、有洞察力的分析报告。""",
-        "needs_ai_processing": True
-    }
+请提供专业、有洞察力的分析报告。
+
+**数据描述：**
+{data_description}
+
+**数据样本：**
+{data_sample}"""
 
 
-def content_improver(content: str, improvement_type: str = "general") -> Dict:
+def data_insight_generator(data_description: str, data_sample: str) -> DataInsightResult:
     """
-    内容智能优化器
+    数据洞察生成器
     
     需要AI能力：
-    - 理解内容意图
-    - 优化表达方式
-    - 提升内容质量
+    - 理解数据含义
+    - 发现数据规律和趋势
+    - 提供有价值的洞察
     
     Args:
-        content: 原始内容
-        improvement_type: 优化类型 (general/professional/casual/persuasive)
+        data_description: 数据描述
+        data_sample: 数据样本（文本形式）
         
     Returns:
-        包含内容和优化指令的字典
+        包含数据和分析指令的结果
     """
-    type_instructions = {
-        "general": "提升整体质量，使表达更清晰、更有说服力",
-        "professional": "改写为更专业、更正式的商务风格",
-        "casual": "改写为更轻松、更易读的口语化风格",
-        "persuasive": "增强说服力，让内容更有感染力"
-    }
-    
-    instruction_detail = type_instructions.get(improvement_type, type_instructions["general"])
-    
-    return {
-        "original_content": content,
-        "improvement_type": improvement_type,
-        "instruction": f"""请帮助优化以下内容，优化方向：{instruction_detail}
+    return DataInsightResult(
+        data_description=data_description,
+        data_sample=data_sample,
+        instruction=LazyPrompt(functools.partial(
+            _DATA_INSIGHT_TEMPLATE.format,
+            data_description=data_description, data_sample=data_sample
+        ))
+    )
 
-**原始内容：**
-{content}
+
+_CONTENT_IMPROVER_TEMPLATE = """请帮助优化给定内容。
 
 请提供：
 
@@ -356,36 +1002,50 @@ def content_improver(content: str, improvement_type: str = "general") -> Dict:
    - 进一步改进的空间
    - 适用场景建议
 
-请提供高质量的优化结果。""",
-        "needs_ai_processing": True
-    }
+请提供高质量的优化结果。
+
+**优化方向：**{instruction_detail}
+
+**原始内容：**
+{content}"""
 
 
-def problem_solver(problem: str, context: str = "") -> Dict:
+def content_improver(content: str, improvement_type: str = "general") -> ContentImprovementResult:
     """
-    智能问题解决器
+    内容智能优化器
     
     需要AI能力：
-    - 理解问题本质
-    - 分解复杂问题
-    - 提供系统性解决方案
+    - 理解内容意图
+    - 优化表达方式
+    - 提升内容质量
     
     Args:
-        problem: 问题描述
-        context: 背景信息
+        content: 原始内容
+        improvement_type: 优化类型 (general/professional/casual/persuasive)
         
     Returns:
-        包含问题和求解指令的字典
+        包含内容和优化指令的结果
     """
-    context_text = f"\n\n**背景信息：**\n{context}" if context else ""
+    type_instructions = {
+        "general": "提升整体质量，使表达更清晰、更有说服力",
+        "professional": "改写为更专业、更正式的商务风格",
+        "casual": "改写为更轻松、更易读的口语化风格",
+        "persuasive": "增强说服力，让内容更有感染力"
+    }
     
-    return {
-        "problem": problem,
-        "context": context,
-        "instruction": f"""请作为问题解决专家，帮助分析和解决以下问题：
+    instruction_detail = type_instructions.get(improvement_type, type_instructions["general"])
+    
+    return ContentImprovementResult(
+        original_content=content,
+        improvement_type=improvement_type,
+        instruction=LazyPrompt(functools.partial(
+            _CONTENT_IMPROVER_TEMPLATE.format,
+            instruction_detail=instruction_detail, content=content
+        ))
+    )
 
-**问题描述：**
-{problem}{context_text}
+
+_PROBLEM_SOLVER_TEMPLATE = """请作为问题解决专家，帮助分析和解决给定问题。
 
 请提供系统性的解决方案：
 
@@ -407,32 +1067,41 @@ def problem_solver(problem: str, context: str = "") -> Dict:
    - 可能的困难
    - 应对措施
 
-请提供详细、可行的解决方案。""",
-        "needs_ai_processing": True
-    }
+请提供详细、可行的解决方案。
+
+**问题描述：**
+{problem}{context_text}"""
 
 
-def meeting_summarizer(meeting_notes: str) -> Dict:
+def problem_solver(problem: str, context: str = "") -> ProblemSolvingResult:
     """
-    会议智能总结器
+    智能问题解决器
     
     需要AI能力：
-    - 理解会议内容
-    - 提取关键信息
-    - 结构化呈现
+    - 理解问题本质
+    - 分解复杂问题
+    - 提供系统性解决方案
     
     Args:
-        meeting_notes: 会议记录或录音转文字
+        problem: 问题描述
+        context: 背景信息
         
     Returns:
-        包含会议内容和总结指令的字典
+        包含问题和求解指令的结果
     """
-    return {
-        "meeting_notes": meeting_notes,
-        "instruction": f"""请作为会议助理，对以下会议内容进行智能总结：
+    context_text = f"\n\n**背景信息：**\n{context}" if context else ""
+    
+    return ProblemSolvingResult(
+        problem=problem,
+        context=context,
+        instruction=LazyPrompt(functools.partial(
+            _PROBLEM_SOLVER_TEMPLATE.format,
+            problem=problem, context_text=context_text
+        ))
+    )
 
-**会议记录：**
-{meeting_notes}
+
+_MEETING_SUMMARY_TEMPLATE = """请作为会议助理，对给定的会议内容进行智能总结。
 
 请提供结构化的会议总结：
 
@@ -459,44 +1128,37 @@ def meeting_summarizer(meeting_notes: str) -> Dict:
    - 未解决的问题
    - 需要跟进的事项
 
-请提供清晰、完整的会议总结。""",
-        "needs_ai_processing": True
-    }
+请提供清晰、完整的会议总结。
+
+**会议记录：**
+{meeting_notes}"""
 
 
-def learning_path_designer(topic: str, current_level: str = "beginner", goal: str = "") -> Dict:
+def meeting_summarizer(meeting_notes: str) -> MeetingSummaryResult:
     """
-    学习路径设计器
+    会议智能总结器
     
     需要AI能力：
-    - 理解知识体系
-    - 设计学习路径
-    - 提供个性化建议
+    - 理解会议内容
+    - 提取关键信息
+    - 结构化呈现
     
     Args:
-        topic: 学习主题
-        current_level: 当前水平 (beginner/intermediate/advanced)
-        goal: 学习目标
+        meeting_notes: 会议记录或录音转文字
         
     Returns:
-        包含学习路径设计指令的字典
+        包含会议内容和总结指令的结果
     """
-    level_desc = {
-        "beginner": "零基础新手",
-        "intermediate": "有一定基础",
-        "advanced": "进阶学习者"
-    }
-    
-    current_desc = level_desc.get(current_level, "初学者")
-    goal_text = f"\n\n**学习目标：**\n{goal}" if goal else ""
-    
-    return {
-        "topic": topic,
-        "current_level": current_level,
-        "goal": goal,
-        "instruction": f"""请作为学习顾问，为"{topic}"设计一个系统的学习路径：
+    return MeetingSummaryResult(
+        meeting_notes=meeting_notes,
+        instruction=LazyPrompt(functools.partial(
+            _MEETING_SUMMARY_TEMPLATE.format,
+            meeting_notes=meeting_notes
+        ))
+    )
+
 
-**当前水平：**{current_desc}{goal_text}
+_LEARNING_PATH_TEMPLATE = """请作为学习顾问，为给定主题设计一个系统的学习路径。
 
 请提供详细的学习路径规划：
 
@@ -523,9 +1185,48 @@ def learning_path_designer(topic: str, current_level: str = "beginner", goal: st
    - 深入学习的方向
    - 相关领域拓展
 
-请提供实用、系统的学习路径。""",
-        "needs_ai_processing": True
+请提供实用、系统的学习路径。
+
+**学习主题：**"{topic}"
+
+**当前水平：**{current_desc}{goal_text}"""
+
+
+def learning_path_designer(topic: str, current_level: str = "beginner", goal: str = "") -> LearningPathResult:
+    """
+    学习路径设计器
+    
+    需要AI能力：
+    - 理解知识体系
+    - 设计学习路径
+    - 提供个性化建议
+    
+    Args:
+        topic: 学习主题
+        current_level: 当前水平 (beginner/intermediate/advanced)
+        goal: 学习目标
+        
+    Returns:
+        包含学习路径设计指令的结果
+    """
+    level_desc = {
+        "beginner": "零基础新手",
+        "intermediate": "有一定基础",
+        "advanced": "进阶学习者"
     }
+    
+    current_desc = level_desc.get(current_level, "初学者")
+    goal_text = f"\n\n**学习目标：**\n{goal}" if goal else ""
+    
+    return LearningPathResult(
+        topic=topic,
+        current_level=current_level,
+        goal=goal,
+        instruction=LazyPrompt(functools.partial(
+            _LEARNING_PATH_TEMPLATE.format,
+            topic=topic, current_desc=current_desc, goal_text=goal_text
+        ))
+    )
 
 
 # 工具定义（用于注册到 Agent）
@@ -714,73 +1415,92 @@ AI_POWERED_TOOL_DEFINITIONS = {
 }
 
 
+# 工具列表在模块加载时由工具定义构建一次，描述和参数只在工具定义中维护
+_AI_POWERED_TOOLS = [
+    {
+        "name": name,
+        "func": globals()[name],
+        "description": definition["description"],
+        "parameters": definition["parameters"]
+    }
+    for name, definition in AI_POWERED_TOOL_DEFINITIONS.items()
+]
+
+
 def get_ai_powered_tools():
     """
     获取AI驱动的工具列表
     
     Returns:
-        工具信息列表
-    """
-    return [
-        {
-            "name": "web_content_analyzer",
-            "func": web_content_analyzer,
-            "description": "智能网页内容分析器。抓取网页并进行深度分析，包括内容摘要、关键词提取、情感分析等。需要AI的理解和分析能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["web_content_analyzer"]["parameters"]
-        },
-        {
-            "name": "text_quality_analyzer",
-            "func": text_quality_analyzer,
-            "description": "文本质量智能分析器。分析文本的语言表达、逻辑结构、语法错误，并提供专业的改进建议。需要AI的语言理解和评估能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["text_quality_analyzer"]["parameters"]
-        },
-        {
-            "name": "creative_idea_generator",
-            "func": creative_idea_generator,
-            "description": "创意想法生成器。为特定主题生成创新性的想法，包括商业模式、产品功能、营销方案等。需要AI的创造力和发散思维。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["creative_idea_generator"]["parameters"]
-        },
-        {
-            "name": "code_review_assistant",
-            "func": code_review_assistant,
-            "description": "代码智能审查助手。对代码进行专业审查，发现潜在问题、提供优化建议和改进方案。需要AI的代码理解和工程经验。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["code_review_assistant"]["parameters"]
-        },
-        {
-            "name": "decision_analyzer",
-            "func": decision_analyzer,
-            "description": "决策智能分析器。分析决策场景，对比各个方案的优劣，提供理性的决策建议。需要AI的多维度分析和推理能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["decision_analyzer"]["parameters"]
-        },
-        {
-            "name": "data_insight_generator",
-            "func": data_insight_generator,
-            "description": "数据洞察生成器。分析数据样本，发现规律和趋势，提供有价值的数据洞察。需要AI的数据理解和分析能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["data_insight_generator"]["parameters"]
-        },
-        {
-            "name": "content_improver",
-            "func": content_improver,
-            "description": "内容智能优化器。优化文本内容的表达方式，提升内容质量。支持多种风格转换。需要AI的语言生成和改写能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["content_improver"]["parameters"]
-        },
-        {
-            "name": "problem_solver",
-            "func": problem_solver,
-            "description": "智能问题解决器。分析复杂问题，提供系统性的解决方案和实施步骤。需要AI的问题分解和推理能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["problem_solver"]["parameters"]
-        },
-        {
-            "name": "meeting_summarizer",
-            "func": meeting_summarizer,
-            "description": "会议智能总结器。将会议记录转换为结构化的会议总结，包括讨论要点、决策事项、待办任务等。需要AI的信息提取和结构化能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["meeting_summarizer"]["parameters"]
-        },
-        {
-            "name": "learning_path_designer",
-            "func": learning_path_designer,
-            "description": "学习路径设计器。为特定主题设计系统的学习路径，包括知识体系、学习资源、实践建议等。需要AI的知识整合和规划能力。",
-            "parameters": AI_POWERED_TOOL_DEFINITIONS["learning_path_designer"]["parameters"]
-        }
-    ]
+        工具信息列表（浅拷贝，调用方可自由修改列表本身）
+    """
+    return list(_AI_POWERED_TOOLS)
 
+
+# 批量调用时各工具指令之间的分隔符
+TOOL_BOUNDARY = "---TOOL_BOUNDARY---"
+
+_BATCH_TEMPLATE = """以下包含 {count} 个相互独立的任务，任务之间用 {boundary} 分隔。
+请依次完成每个任务，并在各任务的回答之间单独输出一行 {boundary}，回答顺序与任务顺序一致。
+
+{instructions}"""
+
+
+def batch_invoke(calls: List[Tuple[str, Dict]]) -> Dict:
+    """
+    批量调用多个AI工具，将各工具的指令合并为一次大模型请求
+    
+    多个相互独立的工具调用合并后只需一次请求，节省每次请求的网络往返和提示词预填充开销。
+    大模型的回复可以用 split_batch_response 按工具拆分。
+    
+    Args:
+        calls: (工具名称, 参数字典) 列表
+        
+    Returns:
+        包含各工具结果和合并指令的字典
+    """
+    tool_functions = {tool["name"]: tool["func"] for tool in _AI_POWERED_TOOLS}
+    
+    results = []
+    instructions = []
+    for name, args in calls:
+        if name not in tool_functions:
+            return {"error": f"未找到工具: {name}"}
+        
+        result = tool_functions[name](**args)
+        if "error" in result:
+            return {"error": f"{name} 执行失败: {result['error']}"}
+        
+        results.append({"name": name, "result": result})
+        instructions.append(str(result["instruction"]))
+    
+    separator = f"\n\n{TOOL_BOUNDARY}\n\n"
+    return {
+        "results": results,
+        "instruction": _BATCH_TEMPLATE.format(
+            count=len(instructions),
+            boundary=TOOL_BOUNDARY,
+            instructions=separator.join(instructions)
+        ),
+        "needs_ai_processing": True
+    }
+
+
+def split_batch_response(response: str, count: int) -> List[str]:
+    """
+    按分隔符拆分批量调用的大模型回复
+    
+    Args:
+        response: 大模型对 batch_invoke 合并指令的回复
+        count: 批量调用的工具数量
+        
+    Returns:
+        各工具对应的回复列表，数量不足时用空字符串补齐；多出的分隔符之后的
+        内容保留在最后一项中，不会丢弃
+    """
+    if count <= 0:
+        return []
+    
+    parts = [part.strip() for part in response.split(TOOL_BOUNDARY, count - 1)]
+    parts.extend([""] * (count - len(parts)))
+    return parts
@@ -5,11 +5,27 @@
 """
 
 from datetime import datetime
+from functools import lru_cache
+from math import isqrt
+import ast
 import operator
+import os
+import orjson
 import random
-import uuid
-import base64
-from typing import Optional
+import time
+import binascii
+from types import MappingProxyType
+from typing import List, Optional
+
+# 可选的 SIMD 加速 Base64 编解码，未安装时使用标准库
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
+
+# get_current_time 的缓存：(秒级时间戳, 格式化后的时间)，同一秒内直接复用
+_time_cache = (None, "")
 
 
 def get_current_time() -> str:
@@ -19,7 +35,106 @@ def get_current_time() -> str:
     Returns:
         当前时间的字符串表示
     """
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _time_cache
+    second = int(time.time())
+    cached_second, formatted = _time_cache
+    if second != cached_second:
+        formatted = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+        _time_cache = (second, formatted)
+    return formatted
+
+
+# calculate 支持的运算符
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# 整数运算结果的位数上限，在计算前估算结果大小，避免 9**9**9、
+# ((9**999)**999)**999 这类表达式耗尽 CPU 和内存
+_MAX_RESULT_BITS = 1 << 16
+
+
+def _check_result_size(op: ast.operator, left: float, right: float) -> None:
+    """
+    在计算前估算整数幂运算和乘法结果的位数，过大时拒绝
+    
+    Args:
+        op: 运算符节点
+        left: 左操作数
+        right: 右操作数
+    """
+    if type(left) is not int or type(right) is not int:
+        # 浮点数运算溢出时会抛出 OverflowError，不会无限增长
+        return
+    if isinstance(op, ast.Pow):
+        # 底数为 0、1、-1 时结果不会增长，负指数得到浮点数
+        if right > 0 and abs(left) > 1 and abs(left).bit_length() * right > _MAX_RESULT_BITS:
+            raise ValueError("计算结果过大")
+    elif isinstance(op, ast.Mult):
+        if abs(left).bit_length() + abs(right).bit_length() > _MAX_RESULT_BITS:
+            raise ValueError("计算结果过大")
+
+# calculate 允许的字符，在解析前快速拒绝其他输入
+_ALLOWED_CHARS = b"0123456789+-*/(). "
+
+
+def _eval_node(node: ast.expr) -> float:
+    """
+    对表达式语法树求值，只允许数字和基本运算
+    
+    Args:
+        node: 语法树节点
+        
+    Returns:
+        计算结果
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        _check_result_size(node.op, left, right)
+        return _BINARY_OPERATORS[type(node.op)](left, right)
+    
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_eval_node(node.operand))
+    
+    raise ValueError("表达式包含不允许的字符")
+
+
+@lru_cache(maxsize=1024)
+def _evaluate(expression: str) -> float:
+    """
+    解析并计算数学表达式（相同表达式只计算一次）
+    
+    Args:
+        expression: 数学表达式字符串
+        
+    Returns:
+        计算结果
+    """
+    try:
+        node = ast.parse(expression.strip(), mode="eval").body
+    except Exception as e:
+        raise ValueError(f"计算错误: {str(e)}")
+    
+    try:
+        return float(_eval_node(node))
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"计算错误: {str(e)}")
 
 
 def calculate(expression: str) -> float:
@@ -33,17 +148,17 @@ def calculate(expression: str) -> float:
         计算结果
     """
     # 安全的数学表达式求值
-    # 只允许数字和基本运算符
-    allowed_chars = set("0123456789+-*/(). ")
-    
-    if not all(c in allowed_chars for c in expression):
+    # 基于语法树逐节点求值，只允许数字和基本运算符，不使用 eval
+    # 删除允许的字符后仍有剩余即包含非法字符；非 ASCII 字符编码为 '?'，同样会被拒绝
+    if expression.encode('ascii', 'replace').translate(None, _ALLOWED_CHARS):
         raise ValueError("表达式包含不允许的字符")
     
-    try:
-        result = eval(expression, {"__builtins__": {}}, {})
-        return float(result)
-    except Exception as e:
-        raise ValueError(f"计算错误: {str(e)}")
+    return _evaluate(expression)
+
+
+# search_wikipedia 模拟结果的固定前后缀
+_WIKIPEDIA_PREFIX = "关于 '"
+_WIKIPEDIA_SUFFIX = "' 的维基百科搜索结果：这是一个示例工具的模拟返回。在实际应用中，这里会调用真实的维基百科 API。"
 
 
 def search_wikipedia(query: str) -> str:
@@ -57,8 +172,15 @@ def search_wikipedia(query: str) -> str:
         搜索结果摘要
     """
     # 这是一个模拟实现
-    # 实际使用时可以调用真实的维基百科 API
-    return f"关于 '{query}' 的维基百科搜索结果：这是一个示例工具的模拟返回。在实际应用中，这里会调用真实的维基百科 API。"
+    # 实际使用时可以调用真实的维基百科 API，届时应使用 lru_cache 缓存相同查询的网络请求结果
+    return _WIKIPEDIA_PREFIX + query + _WIKIPEDIA_SUFFIX
+
+
+# 预先绑定，省去每次调用的属性查找和 randint 包装层
+_randrange = random.randrange
+
+# 批量随机数使用的 NumPy PCG64 生成器，首次使用时创建
+_rng = None
 
 
 def get_random_number(min_value: int = 1, max_value: int = 100) -> int:
@@ -72,7 +194,41 @@ def get_random_number(min_value: int = 1, max_value: int = 100) -> int:
     Returns:
         随机整数
     """
-    return random.randint(min_value, max_value)
+    return _randrange(min_value, max_value + 1)
+
+
+def get_random_numbers(count: int, min_value: int = 1, max_value: int = 100) -> List[int]:
+    """
+    批量生成指定范围内的随机整数
+    
+    Args:
+        count: 生成数量
+        min_value: 最小值（包含）
+        max_value: 最大值（包含）
+        
+    Returns:
+        随机整数列表
+    """
+    global _rng
+    if _rng is None:
+        import numpy as np
+        
+        _rng = np.random.default_rng()
+    return _rng.integers(min_value, max_value, size=count, endpoint=True).tolist()
+
+
+# 各温度单位与摄氏度之间的换算
+_TO_CELSIUS = {
+    'C': lambda value: value,
+    'F': lambda value: (value - 32) * 5/9,
+    'K': lambda value: value - 273.15,
+}
+
+_FROM_CELSIUS = {
+    'C': lambda celsius: celsius,
+    'F': lambda celsius: celsius * 9/5 + 32,
+    'K': lambda celsius: celsius + 273.15,
+}
 
 
 def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
@@ -87,25 +243,17 @@ def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
     Returns:
         转换后的温度值
     """
-    # 先转换为摄氏度
-    if from_unit.upper() == 'C':
-        celsius = value
-    elif from_unit.upper() == 'F':
-        celsius = (value - 32) * 5/9
-    elif from_unit.upper() == 'K':
-        celsius = value - 273.15
-    else:
+    try:
+        to_celsius = _TO_CELSIUS[from_unit.upper()]
+    except KeyError:
         raise ValueError(f"不支持的温度单位: {from_unit}")
-    
-    # 再从摄氏度转换为目标单位
-    if to_unit.upper() == 'C':
-        return round(celsius, 2)
-    elif to_unit.upper() == 'F':
-        return round(celsius * 9/5 + 32, 2)
-    elif to_unit.upper() == 'K':
-        return round(celsius + 273.15, 2)
-    else:
+    try:
+        from_celsius = _FROM_CELSIUS[to_unit.upper()]
+    except KeyError:
         raise ValueError(f"不支持的温度单位: {to_unit}")
+    
+    # 先转换为摄氏度，再从摄氏度转换为目标单位
+    return round(from_celsius(to_celsius(value)), 2)
 
 
 def string_reverse(text: str) -> str:
@@ -118,6 +266,7 @@ def string_reverse(text: str) -> str:
     Returns:
         反转后的字符串
     """
+    # 切片在 C 层按字符宽度直接反向复制；经 NumPy 字节数组反转需要额外的编解码，长文本反而更慢
     return text[::-1]
 
 
@@ -131,15 +280,41 @@ def count_words(text: str) -> dict:
     Returns:
         包含统计信息的字典
     """
-    words = text.split()
+    # 用 count 代替 replace/split('\n')，不创建中间字符串和列表
+    total_characters = len(text)
     return {
-        "total_characters": len(text),
-        "total_characters_no_spaces": len(text.replace(" ", "")),
-        "total_words": len(words),
-        "total_lines": len(text.split('\n'))
+        "total_characters": total_characters,
+        "total_characters_no_spaces": total_characters - text.count(" "),
+        "total_words": len(text.split()),
+        "total_lines": text.count("\n") + 1
     }
 
 
+# 星期名称，按 datetime.weekday() 的顺序
+_WEEKDAY_NAMES = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
+
+def _parse_date(date_str: str) -> datetime:
+    """
+    解析 YYYY-MM-DD 格式的日期
+    
+    标准的 10 位格式直接按位置取年月日，跳过 strptime 的通用格式解析；
+    其他写法（如 2025-1-5）仍交给 strptime 处理。
+    
+    Args:
+        date_str: 日期字符串
+        
+    Returns:
+        日期时间对象
+    """
+    if (
+        len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+        and date_str[:4].isdigit() and date_str[5:7].isdigit() and date_str[8:].isdigit()
+    ):
+        return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
 def get_date_info(date_str: Optional[str] = None) -> dict:
     """
     获取日期信息
@@ -152,20 +327,19 @@ def get_date_info(date_str: Optional[str] = None) -> dict:
     """
     if date_str:
         try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
+            date = _parse_date(date_str)
         except ValueError:
             raise ValueError("日期格式错误，应为 YYYY-MM-DD")
     else:
         date = datetime.now()
     
-    weekday_names = ["周一", "周二", "周三", "周四", "周五", "周六", "周日"]
-    
+    weekday = date.weekday()
     return {
         "date": date.strftime("%Y-%m-%d"),
-        "weekday": weekday_names[date.weekday()],
-        "day_of_year": date.timetuple().tm_yday,
+        "weekday": _WEEKDAY_NAMES[weekday],
+        "day_of_year": (date - datetime(date.year, 1, 1)).days + 1,
         "week_of_year": date.isocalendar()[1],
-        "is_weekend": date.weekday() >= 5
+        "is_weekend": weekday >= 5
     }
 
 
@@ -180,7 +354,7 @@ def calculate_age(birth_date: str) -> dict:
         包含年龄信息的字典
     """
     try:
-        birth = datetime.strptime(birth_date, "%Y-%m-%d")
+        birth = _parse_date(birth_date)
     except ValueError:
         raise ValueError("日期格式错误，应为 YYYY-MM-DD")
     
@@ -202,6 +376,20 @@ def calculate_age(birth_date: str) -> dict:
     }
 
 
+def _fast_uuid4() -> str:
+    """
+    直接由随机字节生成 UUID v4 字符串，跳过 uuid.UUID 对象的构造和校验
+    
+    Returns:
+        UUID字符串
+    """
+    data = bytearray(os.urandom(16))
+    data[6] = (data[6] & 0x0f) | 0x40  # 版本号 4
+    data[8] = (data[8] & 0x3f) | 0x80  # RFC 4122 变体
+    h = data.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 def generate_uuid(version: int = 4) -> str:
     """
     生成UUID
@@ -213,9 +401,11 @@ def generate_uuid(version: int = 4) -> str:
         UUID字符串
     """
     if version == 1:
+        import uuid
+        
         return str(uuid.uuid1())
     elif version == 4:
-        return str(uuid.uuid4())
+        return _fast_uuid4()
     else:
         raise ValueError("只支持UUID版本1和4")
 
@@ -230,8 +420,12 @@ def encode_base64(text: str) -> str:
     Returns:
         Base64编码后的字符串
     """
-    encoded_bytes = base64.b64encode(text.encode('utf-8'))
-    return encoded_bytes.decode('utf-8')
+    # 不带参数的 encode() 省去编码名称查找；纯 ASCII 文本在 UTF-8 编码器中本就是直接复制，无需单独分支
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(text.encode())
+    
+    # binascii 一次 C 调用完成编码，省去 base64.b64encode 的包装层
+    return binascii.b2a_base64(text.encode(), newline=False).decode('ascii')
 
 
 def decode_base64(encoded_text: str) -> str:
@@ -245,22 +439,109 @@ def decode_base64(encoded_text: str) -> str:
         解码后的文本
     """
     try:
-        decoded_bytes = base64.b64decode(encoded_text.encode('utf-8'))
+        # 先去掉空白（MIME 按行折叠的输出、末尾换行），再按 ASCII 编码严格校验：
+        # 其他非 Base64 字符直接报错，而不是被跳过后解码剩余部分
+        data = "".join(encoded_text.split()).encode('ascii')
+        if pybase64 is not None:
+            decoded_bytes = pybase64.b64decode(data, validate=True)
+        else:
+            decoded_bytes = binascii.a2b_base64(data, strict_mode=True)
         return decoded_bytes.decode('utf-8')
     except Exception as e:
         raise ValueError(f"Base64解码失败: {str(e)}")
 
 
+# check_prime 的质数筛表：_SIEVE[n] 为 1 表示 n 是质数
+_SIEVE_LIMIT = 2000
+_SIEVE = bytearray([1]) * _SIEVE_LIMIT
+_SIEVE[0] = _SIEVE[1] = 0
+for _i in range(2, isqrt(_SIEVE_LIMIT) + 1):
+    if _SIEVE[_i]:
+        _SIEVE[_i * _i::_i] = bytes(len(range(_i * _i, _SIEVE_LIMIT, _i)))
+del _i
+
+# 用于试除的奇质数
+_SMALL_ODD_PRIMES = tuple(i for i in range(3, _SIEVE_LIMIT) if _SIEVE[i])
+
+# Miller-Rabin 见证数，前 13 个质数对小于该上限的数是确定性的
+_MILLER_RABIN_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MILLER_RABIN_DETERMINISTIC_LIMIT = 3317044064679887385961981
+
+
+def _miller_rabin(number: int) -> bool:
+    """
+    Miller-Rabin 质数测试
+    
+    Args:
+        number: 大于 2 的奇数
+        
+    Returns:
+        是否为质数
+    """
+    # 分解 number - 1 = d * 2^s
+    d = number - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in _MILLER_RABIN_WITNESSES:
+        x = pow(a, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, number)
+            if x == number - 1:
+                break
+        else:
+            return False
+    
+    return True
+
+
+def _as_integer(value) -> Optional[int]:
+    """
+    把 7.0、"7" 这类整数值转换为 int
+    
+    Args:
+        value: 原始输入
+        
+    Returns:
+        对应的整数，不是整数值时返回 None
+    """
+    if isinstance(value, int):
+        return value
+    try:
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                value = float(value)
+        integer = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return integer if integer == value else None
+
+
 def check_prime(number: int) -> dict:
     """
     检查一个数是否为质数
     
     Args:
-        number: 要检查的数字
+        number: 要检查的数字，7.0 这类整数值的浮点数会按整数处理
         
     Returns:
         包含检查结果的字典
     """
+    integer = _as_integer(number)
+    if integer is None:
+        return {
+            "number": number,
+            "is_prime": False,
+            "reason": "只有整数才能判断是否为质数"
+        }
+    number = integer
+    
     if number < 2:
         return {
             "number": number,
@@ -282,22 +563,159 @@ def check_prime(number: int) -> dict:
             "reason": "偶数（除2外）不是质数"
         }
     
-    # 检查奇数因子
-    for i in range(3, int(number ** 0.5) + 1, 2):
-        if number % i == 0:
+    # 小于筛表上限的数直接查表
+    if number < _SIEVE_LIMIT and _SIEVE[number]:
+        return {
+            "number": number,
+            "is_prime": True,
+            "reason": "没有找到除1和自身外的因数"
+        }
+    
+    # 用小质数试除，能找到最小因数；isqrt 是精确的整数平方根，大数也不会有浮点误差
+    root = isqrt(number)
+    for p in _SMALL_ODD_PRIMES:
+        if p > root:
+            return {
+                "number": number,
+                "is_prime": True,
+                "reason": "没有找到除1和自身外的因数"
+            }
+        if number % p == 0:
             return {
                 "number": number,
                 "is_prime": False,
-                "reason": f"能被{i}整除"
+                "reason": f"能被{p}整除"
             }
     
+    # 没有小因数的大数使用 Miller-Rabin 测试
+    if _miller_rabin(number):
+        if number < _MILLER_RABIN_DETERMINISTIC_LIMIT:
+            reason = "通过 Miller-Rabin 确定性测试"
+        else:
+            reason = "通过 Miller-Rabin 测试（极大数为概率性判定）"
+        return {
+            "number": number,
+            "is_prime": True,
+            "reason": reason
+        }
+    
     return {
         "number": number,
-        "is_prime": True,
-        "reason": "没有找到除1和自身外的因数"
+        "is_prime": False,
+        "reason": "Miller-Rabin 测试判定为合数"
     }
 
 
+def encode_base64_many(texts: List[str]) -> List[str]:
+    """
+    批量Base64编码
+    
+    Args:
+        texts: 要编码的文本列表
+        
+    Returns:
+        Base64编码后的字符串列表
+    """
+    if pybase64 is not None:
+        encode = pybase64.b64encode_as_string
+        return [encode(text.encode()) for text in texts]
+    
+    b2a = binascii.b2a_base64
+    return [b2a(text.encode(), newline=False).decode('ascii') for text in texts]
+
+
+# numba 批量质数检查只处理 31 位以内的数，保证模乘结果不会超出 int64
+_BATCH_PRIME_LIMIT = 2 ** 31
+
+# 编译后的并行质数检查函数：None 表示尚未初始化，False 表示未安装 numba
+_check_primes_parallel = None
+
+
+def _get_check_primes_parallel():
+    """
+    获取 numba 编译的并行质数检查函数，首次调用时导入 numba 并编译
+    
+    Returns:
+        编译后的函数，未安装 numba 时返回 None
+    """
+    global _check_primes_parallel
+    if _check_primes_parallel is not None:
+        return _check_primes_parallel or None
+    
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        _check_primes_parallel = False
+        return None
+    
+    @numba.njit
+    def miller_rabin(n):
+        if n < 2:
+            return False
+        for p in (2, 3, 5, 7, 11):
+            if n % p == 0:
+                return n == p
+        d = n - 1
+        s = 0
+        while d % 2 == 0:
+            d //= 2
+            s += 1
+        # 见证数 2、3、5、7、11 对小于 2152302898747 的数是确定性的
+        for a in (2, 3, 5, 7, 11):
+            x = 1
+            base = a
+            e = d
+            while e > 0:
+                if e & 1:
+                    x = x * base % n
+                base = base * base % n
+                e >>= 1
+            if x == 1 or x == n - 1:
+                continue
+            composite = True
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    composite = False
+                    break
+            if composite:
+                return False
+        return True
+    
+    @numba.njit(parallel=True)
+    def check_primes(numbers):
+        result = np.empty(numbers.shape[0], dtype=np.bool_)
+        for i in numba.prange(numbers.shape[0]):
+            result[i] = miller_rabin(numbers[i])
+        return result
+    
+    _check_primes_parallel = check_primes
+    return _check_primes_parallel
+
+
+def check_prime_many(numbers: List[int]) -> List[bool]:
+    """
+    批量检查质数
+    
+    安装了 numba 且所有数都小于 2^31 时，用编译后的并行循环一次处理整个列表。
+    
+    Args:
+        numbers: 要检查的整数列表
+        
+    Returns:
+        与 numbers 顺序一致的是否为质数列表
+    """
+    if numbers and all(type(number) is int and 0 <= number < _BATCH_PRIME_LIMIT for number in numbers):
+        check_primes = _get_check_primes_parallel()
+        if check_primes is not None:
+            import numpy as np
+            
+            return check_primes(np.asarray(numbers, dtype=np.int64)).tolist()
+    
+    return [check_prime(number)["is_prime"] for number in numbers]
+
+
 # 工具定义（用于注册到 Agent）
 TOOL_DEFINITIONS = {
     "get_current_time": {
@@ -492,214 +910,33 @@ TOOL_DEFINITIONS = {
 }
 
 
+# 工具定义的 JSON 序列化结果，在模块加载时生成一次
+_TOOL_DEFINITIONS_JSON = orjson.dumps(TOOL_DEFINITIONS)
+
+
+def get_tool_definitions_json() -> bytes:
+    """
+    获取工具定义的 JSON 字节串，可直接作为 HTTP 请求体的一部分发送，无需重复序列化
+    
+    Returns:
+        UTF-8 编码的 JSON 字节串
+    """
+    return _TOOL_DEFINITIONS_JSON
+
+
+# 工具列表在模块加载时由工具定义构建一次，描述和参数只在工具定义中维护；
+# 条目为只读映射，多次调用共享同一批条目也不会被调用方意外修改
+_BASIC_TOOLS = tuple(
+    MappingProxyType({**definition, "func": globals()[name]})
+    for name, definition in TOOL_DEFINITIONS.items()
+)
+
+
 def get_basic_tools():
     """
     获取基础工具列表，用于注册到 Agent
     
     Returns:
-        工具信息列表
-    """
-    return [
-        {
-            "name": "get_current_time",
-            "func": get_current_time,
-            "description": "获取当前的日期和时间",
-            "parameters": {
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        },
-        {
-            "name": "calculate",
-            "func": calculate,
-            "description": "计算数学表达式。支持加减乘除和括号。",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string",
-                        "description": "要计算的数学表达式，例如 '2 + 3 * 4'"
-                    }
-                },
-                "required": ["expression"]
-            }
-        },
-        {
-            "name": "search_wikipedia",
-            "func": search_wikipedia,
-            "description": "搜索维基百科获取信息",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "搜索关键词"
-                    }
-                },
-                "required": ["query"]
-            }
-        },
-        {
-            "name": "get_random_number",
-            "func": get_random_number,
-            "description": "生成指定范围内的随机整数",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "min_value": {
-                        "type": "integer",
-                        "description": "最小值（包含），默认为1"
-                    },
-                    "max_value": {
-                        "type": "integer",
-                        "description": "最大值（包含），默认为100"
-                    }
-                },
-                "required": []
-            }
-        },
-        {
-            "name": "convert_temperature",
-            "func": convert_temperature,
-            "description": "温度单位转换，支持摄氏度(C)、华氏度(F)、开尔文(K)之间的转换",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "value": {
-                        "type": "number",
-                        "description": "要转换的温度值"
-                    },
-                    "from_unit": {
-                        "type": "string",
-                        "description": "源温度单位：C（摄氏度）、F（华氏度）、K（开尔文）"
-                    },
-                    "to_unit": {
-                        "type": "string",
-                        "description": "目标温度单位：C（摄氏度）、F（华氏度）、K（开尔文）"
-                    }
-                },
-                "required": ["value", "from_unit", "to_unit"]
-            }
-        },
-        {
-            "name": "string_reverse",
-            "func": string_reverse,
-            "description": "反转字符串",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要反转的字符串"
-                    }
-                },
-                "required": ["text"]
-            }
-        },
-        {
-            "name": "count_words",
-            "func": count_words,
-            "description": "统计文本的字符数、单词数和行数",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要统计的文本"
-                    }
-                },
-                "required": ["text"]
-            }
-        },
-        {
-            "name": "get_date_info",
-            "func": get_date_info,
-            "description": "获取日期的详细信息，包括星期几、第几天、第几周等",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "date_str": {
-                        "type": "string",
-                        "description": "日期字符串（格式：YYYY-MM-DD），不传则使用当前日期"
-                    }
-                },
-                "required": []
-            }
-        },
-        {
-            "name": "calculate_age",
-            "func": calculate_age,
-            "description": "根据出生日期计算年龄",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "birth_date": {
-                        "type": "string",
-                        "description": "出生日期（格式：YYYY-MM-DD）"
-                    }
-                },
-                "required": ["birth_date"]
-            }
-        },
-        {
-            "name": "generate_uuid",
-            "func": generate_uuid,
-            "description": "生成UUID（通用唯一识别码）",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "version": {
-                        "type": "integer",
-                        "description": "UUID版本，支持1或4，默认为4"
-                    }
-                },
-                "required": []
-            }
-        },
-        {
-            "name": "encode_base64",
-            "func": encode_base64,
-            "description": "将文本进行Base64编码",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要编码的文本"
-                    }
-                },
-                "required": ["text"]
-            }
-        },
-        {
-            "name": "decode_base64",
-            "func": decode_base64,
-            "description": "将Base64编码的字符串解码为文本",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "encoded_text": {
-                        "type": "string",
-                        "description": "Base64编码的字符串"
-                    }
-                },
-                "required": ["encoded_text"]
-            }
-        },
-        {
-            "name": "check_prime",
-            "func": check_prime,
-            "description": "检查一个数是否为质数",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "number": {
-                        "type": "integer",
-                        "description": "要检查的整数"
-                    }
-                },
-                "required": ["number"]
-            }
-        }
-    ]
+        工具信息列表（条目为只读映射）
+    """
+    return list(_BASIC_TOOLS)
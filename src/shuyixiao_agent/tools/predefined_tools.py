@@ -10,8 +10,12 @@
 - 文本处理工具
 """
 
+import asyncio
+import codecs
+import mmap
 import os
 import json
+import orjson
 import csv
 import requests
 import platform
@@ -20,27 +24,162 @@ import math
 import statistics
 import re
 import hashlib
+import heapq
+from http.cookiejar import DefaultCookiePolicy
+import ast
+import operator
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import shutil
 import subprocess
 import sys
+import time
 
 from ..agents.tool_use_agent import ToolDefinition, ToolParameter, ToolType
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# 工具输出统一使用 orjson 序列化，格式与 json.dumps(ensure_ascii=False, indent=2) 一致
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# 连续 19 位以上的数字可能是超过 64 位的整数，orjson 会把它读成浮点数而丢失精度
+_LONG_DIGITS_RE = re.compile(r'\d{19}')
+
+
+class _NonFiniteFloat(float):
+    """
+    json.loads 读到的 NaN/Infinity
+    
+    orjson 无法序列化 float 子类，_dumps 因此回退到 json.dumps，原样输出 NaN/Infinity
+    （orjson 会把它们输出为 null）。
+    """
+
+
+def _parse_float(text: str) -> float:
+    """json.loads 的 parse_float，溢出为无穷大的数值标记为 _NonFiniteFloat"""
+    value = float(text)
+    return value if math.isfinite(value) else _NonFiniteFloat(value)
+
+
+def _loads(text: str) -> Any:
+    """
+    解析 JSON 字符串，优先使用 orjson
+    
+    orjson 不接受 NaN/Infinity，且会把超过 64 位的整数读成浮点数，
+    这些情况回退到 json.loads，保持与标准库相同的解析结果。
+    
+    Args:
+        text: JSON 字符串
+        
+    Returns:
+        解析后的对象
+    """
+    if not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text, parse_constant=_NonFiniteFloat, parse_float=_parse_float)
+
+
+def _dumps(obj: Any, pretty: bool = True) -> str:
+    """
+    序列化为 JSON 字符串，orjson 不支持的对象（如超过 64 位的整数）回退到标准库
+    
+    Args:
+        obj: 要序列化的对象
+        pretty: 是否缩进输出，False 时输出紧凑格式
+        
+    Returns:
+        JSON 字符串
+    """
+    try:
+        return orjson.dumps(obj, option=_JSON_OPTIONS if pretty else orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        if pretty:
+            return json.dumps(obj, ensure_ascii=False, indent=2)
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+
+# read_file_bytes 每次 readinto 的缓冲区大小
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _decode_prefix(data: bytes, encoding: str) -> str:
+    """解码截断的字节内容，末尾不完整的多字节字符被丢弃"""
+    return codecs.getincrementaldecoder(encoding)().decode(data)
+
 
 class FileOperationTools:
     """文件操作工具集"""
     
     @staticmethod
-    def read_file(file_path: str, encoding: str = 'utf-8') -> str:
-        """读取文件内容"""
+    def read_file(file_path: str, encoding: str = 'utf-8', max_bytes: Optional[int] = None) -> str:
+        """读取文件内容（max_bytes 限制最多读取的字节数）"""
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            with open(file_path, 'rb') as f:
+                try:
+                    # 内存映射后直接从映射区解码，省去一次完整的字节拷贝
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # 空文件或不支持内存映射的文件（如管道、/proc 下的文件）按普通方式读取
+                    if max_bytes is None:
+                        text = f.read().decode(encoding)
+                    else:
+                        text = _decode_prefix(f.read(max_bytes), encoding)
+                else:
+                    with mm:
+                        if max_bytes is None or max_bytes >= len(mm):
+                            text = str(mm, encoding)
+                        else:
+                            text = _decode_prefix(mm[:max_bytes], encoding)
+            
+            # 与文本模式读取一致，统一换行符
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text
         except Exception as e:
             return f"读取文件失败: {str(e)}"
     
+    @staticmethod
+    def read_file_bytes(file_path: str) -> bytes:
+        """
+        以二进制方式读取文件内容
+        
+        复用同一块 1 MiB 缓冲区分块 readinto，不为每次读取分配新的 bytes 对象
+        
+        Args:
+            file_path: 文件路径
+            
+        Returns:
+            文件的全部字节内容，读取失败时抛出 OSError
+        """
+        data = bytearray()
+        buffer = bytearray(_READ_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            while n := f.readinto(buffer):
+                data += view[:n]
+        return bytes(data)
+    
+    @staticmethod
+    def copy_file(src_path: str, dst_path: str) -> str:
+        """复制文件（由 shutil.copyfile 使用 sendfile/copy_file_range 等内核接口完成）"""
+        try:
+            shutil.copyfile(src_path, dst_path)
+            return f"文件复制成功: {src_path} -> {dst_path}"
+        except Exception as e:
+            return f"复制文件失败: {str(e)}"
+    
     @staticmethod
     def write_file(file_path: str, content: str, encoding: str = 'utf-8') -> str:
         """写入文件内容"""
@@ -57,15 +196,16 @@ class FileOperationTools:
     def list_directory(directory_path: str, show_hidden: bool = False) -> str:
         """列出目录内容"""
         try:
-            items = []
-            for item in os.listdir(directory_path):
-                if not show_hidden and item.startswith('.'):
-                    continue
-                
-                item_path = os.path.join(directory_path, item)
-                item_type = "目录" if os.path.isdir(item_path) else "文件"
-                size = os.path.getsize(item_path) if os.path.isfile(item_path) else "-"
-                items.append(f"{item_type}: {item} ({size} bytes)" if size != "-" else f"{item_type}: {item}")
+            # scandir 在读取目录时顺带返回文件类型，stat 结果也会缓存在条目上；
+            # 每个条目只做一次类型判断，直接选出对应的输出格式
+            with os.scandir(directory_path) as entries:
+                items = [
+                    f"目录: {entry.name}" if entry.is_dir()
+                    else f"文件: {entry.name} ({entry.stat().st_size} bytes)" if entry.is_file()
+                    else f"文件: {entry.name}"
+                    for entry in entries
+                    if show_hidden or not entry.name.startswith('.')
+                ]
             
             return f"目录 {directory_path} 内容:\n" + "\n".join(items)
         except Exception as e:
@@ -93,7 +233,7 @@ class FileOperationTools:
                 "是否为文件": os.path.isfile(file_path)
             }
             
-            return json.dumps(info, ensure_ascii=False, indent=2)
+            return _dumps(info)
         except Exception as e:
             return f"获取文件信息失败: {str(e)}"
     
@@ -113,42 +253,130 @@ class FileOperationTools:
             return f"删除失败: {str(e)}"
 
 
+# ping 次数参数：Windows 为 -n，其他系统为 -c；导入时确定一次
+_PING_COUNT_FLAG = "-n" if platform.system().lower() == "windows" else "-c"
+
+
+def _create_session() -> requests.Session:
+    """
+    创建网络工具共用的 HTTP 会话
+    
+    复用连接池避免每次请求重新建立 TCP/TLS 连接；不保存 Cookie，
+    与之前每次调用 requests.get/post 的行为保持一致。
+    
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+# http_get/http_post 返回内容的最大字符数
+_CONTENT_PREVIEW_CHARS = 1000
+
+
+def _read_text_prefix(response, limit: int = _CONTENT_PREVIEW_CHARS) -> str:
+    """
+    读取流式响应内容的前 limit 个字符
+    
+    UTF-8 单个字符最多 4 字节，因此最多只下载 limit * 4 字节，不会为了截取
+    开头部分而下载并解码整个响应体。
+    
+    Args:
+        response: 以 stream=True 发起的 requests 响应
+        limit: 最大字符数
+        
+    Returns:
+        响应内容开头的文本
+    """
+    max_bytes = limit * 4
+    data = bytearray()
+    for chunk in response.iter_content(chunk_size=max_bytes):
+        data += chunk
+        if len(data) >= max_bytes:
+            break
+    
+    try:
+        text = data[:max_bytes].decode(response.encoding or 'utf-8', errors='replace')
+    except LookupError:
+        text = data[:max_bytes].decode('utf-8', errors='replace')
+    return text[:limit]
+
+
 class NetworkTools:
     """网络请求工具集"""
     
     @staticmethod
-    def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> str:
-        """发送HTTP GET请求"""
+    def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: int = 30,
+                 pretty: bool = False) -> str:
+        """发送HTTP GET请求（pretty 为 False 时返回紧凑 JSON，便于程序处理）"""
         try:
-            response = requests.get(url, headers=headers or {}, timeout=timeout)
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text[:1000],  # 限制内容长度
-                "success": response.status_code == 200
-            }, ensure_ascii=False, indent=2)
+            with _SESSION.get(url, headers=headers or {}, timeout=timeout, stream=True) as response:
+                return _dumps({
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": _read_text_prefix(response),  # 限制内容长度
+                    "success": response.status_code == 200
+                }, pretty)
         except Exception as e:
             return f"HTTP GET请求失败: {str(e)}"
     
+    @staticmethod
+    async def http_get_many(urls: List[str], headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> str:
+        """并发发送多个HTTP GET请求，总耗时约为最慢的单个请求"""
+        import httpx
+        
+        async def fetch(client, url: str) -> Dict[str, Any]:
+            try:
+                response = await client.get(url)
+                return {
+                    "url": url,
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": response.text[:1000],  # 限制内容长度
+                    "success": response.status_code == 200
+                }
+            except Exception as e:
+                return {"url": url, "success": False, "error": f"HTTP GET请求失败: {str(e)}"}
+        
+        try:
+            async with httpx.AsyncClient(http2=True, headers=headers or {}, timeout=timeout) as client:
+                results = await asyncio.gather(*(fetch(client, url) for url in urls))
+            return _dumps(results)
+        except Exception as e:
+            return f"HTTP GET批量请求失败: {str(e)}"
+    
     @staticmethod
     def http_post(url: str, data: Optional[Dict[str, Any]] = None, 
                   json_data: Optional[Dict[str, Any]] = None,
-                  headers: Optional[Dict[str, str]] = None, timeout: int = 30) -> str:
-        """发送HTTP POST请求"""
+                  headers: Optional[Dict[str, str]] = None, timeout: int = 30,
+                  pretty: bool = False) -> str:
+        """发送HTTP POST请求（pretty 为 False 时返回紧凑 JSON，便于程序处理）"""
         try:
-            response = requests.post(
+            with _SESSION.post(
                 url, 
                 data=data, 
                 json=json_data,
                 headers=headers or {}, 
-                timeout=timeout
-            )
-            return json.dumps({
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "content": response.text[:1000],
-                "success": response.status_code in [200, 201]
-            }, ensure_ascii=False, indent=2)
+                timeout=timeout,
+                stream=True
+            ) as response:
+                return _dumps({
+                    "status_code": response.status_code,
+                    "headers": dict(response.headers),
+                    "content": _read_text_prefix(response),
+                    "success": response.status_code in [200, 201]
+                }, pretty)
         except Exception as e:
             return f"HTTP POST请求失败: {str(e)}"
     
@@ -156,17 +384,30 @@ class NetworkTools:
     def ping_host(host: str, count: int = 4) -> str:
         """Ping主机"""
         try:
-            if platform.system().lower() == "windows":
-                cmd = f"ping -n {count} {host}"
-            else:
-                cmd = f"ping -c {count} {host}"
+            # 以参数列表直接执行 ping，不经过 shell；主机名不能被当成命令行选项
+            if host.startswith('-'):
+                return f"Ping失败: 无效的主机地址 {host}"
             
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+            count = int(count)
+            result = subprocess.run(
+                ["ping", _PING_COUNT_FLAG, str(count), host],
+                capture_output=True, text=True, check=False, timeout=count * 2 + 5
+            )
             return f"Ping结果:\n{result.stdout}"
         except Exception as e:
             return f"Ping失败: {str(e)}"
 
 
+# aggregate_data 各聚合操作对应的归约函数，空分组除 count 外均返回 0
+_AGGREGATIONS = {
+    'sum': sum,
+    'avg': lambda values: sum(values) / len(values) if values else 0,
+    'count': len,
+    'max': lambda values: max(values) if values else 0,
+    'min': lambda values: min(values) if values else 0,
+}
+
+
 class DataProcessingTools:
     """数据处理工具集"""
     
@@ -174,8 +415,8 @@ class DataProcessingTools:
     def parse_json(json_string: str) -> str:
         """解析JSON字符串"""
         try:
-            data = json.loads(json_string)
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            data = _loads(json_string)
+            return _dumps(data)
         except Exception as e:
             return f"JSON解析失败: {str(e)}"
     
@@ -186,7 +427,7 @@ class DataProcessingTools:
             import io
             reader = csv.DictReader(io.StringIO(csv_content), delimiter=delimiter)
             data = list(reader)
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return _dumps(data)
         except Exception as e:
             return f"CSV解析失败: {str(e)}"
     
@@ -194,13 +435,13 @@ class DataProcessingTools:
     def filter_data(data_json: str, filter_key: str, filter_value: str) -> str:
         """过滤数据"""
         try:
-            data = json.loads(data_json)
+            data = _loads(data_json)
             if isinstance(data, list):
                 filtered = [item for item in data if str(item.get(filter_key, '')) == filter_value]
             else:
                 filtered = data if str(data.get(filter_key, '')) == filter_value else {}
             
-            return json.dumps(filtered, ensure_ascii=False, indent=2)
+            return _dumps(filtered)
         except Exception as e:
             return f"数据过滤失败: {str(e)}"
     
@@ -208,13 +449,15 @@ class DataProcessingTools:
     def sort_data(data_json: str, sort_key: str, reverse: bool = False) -> str:
         """排序数据"""
         try:
-            data = json.loads(data_json)
+            data = _loads(data_json)
             if isinstance(data, list):
+                # sorted 对每个元素只调用一次 key，且 reverse=True 时仍保持相等元素的原始顺序；
+                # 实测 lambda 比 methodcaller 或先装饰再排序更快
                 sorted_data = sorted(data, key=lambda x: x.get(sort_key, ''), reverse=reverse)
             else:
                 sorted_data = data
             
-            return json.dumps(sorted_data, ensure_ascii=False, indent=2)
+            return _dumps(sorted_data)
         except Exception as e:
             return f"数据排序失败: {str(e)}"
     
@@ -222,7 +465,7 @@ class DataProcessingTools:
     def aggregate_data(data_json: str, group_key: str, agg_key: str, operation: str = 'sum') -> str:
         """聚合数据"""
         try:
-            data = json.loads(data_json)
+            data = _loads(data_json)
             if not isinstance(data, list):
                 return "数据必须是数组格式"
             
@@ -237,23 +480,63 @@ class DataProcessingTools:
                     groups[group_value].append(agg_value)
             
             result = {}
-            for group, values in groups.items():
-                if operation == 'sum':
-                    result[group] = sum(values)
-                elif operation == 'avg':
-                    result[group] = sum(values) / len(values) if values else 0
-                elif operation == 'count':
-                    result[group] = len(values)
-                elif operation == 'max':
-                    result[group] = max(values) if values else 0
-                elif operation == 'min':
-                    result[group] = min(values) if values else 0
+            reducer = _AGGREGATIONS.get(operation)
+            if reducer is not None:
+                result = {group: reducer(values) for group, values in groups.items()}
             
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            return _dumps(result)
         except Exception as e:
             return f"数据聚合失败: {str(e)}"
 
 
+# 首次采样 CPU 使用率前的预热间隔（秒）
+_CPU_PRIME_INTERVAL = 0.1
+
+
+@lru_cache(maxsize=None)
+def _prime_cpu_percent() -> None:
+    """
+    预热 CPU 使用率采样，只在首次调用 CPU/进程工具时执行一次
+    
+    psutil 的 cpu_percent(interval=None) 返回的是距上次调用以来的使用率，
+    第一次调用总是 0.0；这里先采样一次并等待一个短间隔，进程对象由
+    process_iter 缓存，之后的读取即可得到真实数值。不在导入时执行，
+    避免导入工具包就遍历主机上的所有进程。
+    """
+    psutil.cpu_percent(interval=None)
+    for proc in psutil.process_iter():
+        try:
+            proc.cpu_percent(interval=None)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    time.sleep(_CPU_PRIME_INTERVAL)
+
+
+@lru_cache(maxsize=None)
+def _system_info_json() -> str:
+    """系统信息在进程生命周期内不变，只收集并序列化一次"""
+    info = {
+        "操作系统": platform.system(),
+        "系统版本": platform.release(),
+        "架构": platform.machine(),
+        "处理器": platform.processor(),
+        "Python版本": sys.version,
+        "主机名": platform.node()
+    }
+    return _dumps(info)
+
+
+# get_disk_info 并发查询磁盘用量的线程数上限与总超时（秒）
+_DISK_USAGE_MAX_WORKERS = 8
+_DISK_USAGE_TIMEOUT = 2
+
+
+@lru_cache(maxsize=None)
+def _cpu_counts():
+    """CPU 物理核心数与逻辑 CPU 数"""
+    return psutil.cpu_count(logical=False), psutil.cpu_count(logical=True)
+
+
 class SystemInfoTools:
     """系统信息工具集"""
     
@@ -261,15 +544,7 @@ class SystemInfoTools:
     def get_system_info() -> str:
         """获取系统信息"""
         try:
-            info = {
-                "操作系统": platform.system(),
-                "系统版本": platform.release(),
-                "架构": platform.machine(),
-                "处理器": platform.processor(),
-                "Python版本": sys.version,
-                "主机名": platform.node()
-            }
-            return json.dumps(info, ensure_ascii=False, indent=2)
+            return _system_info_json()
         except Exception as e:
             return f"获取系统信息失败: {str(e)}"
     
@@ -277,13 +552,18 @@ class SystemInfoTools:
     def get_cpu_info() -> str:
         """获取CPU信息"""
         try:
+            physical_count, logical_count = _cpu_counts()
+            _prime_cpu_percent()
+            # interval=None 不阻塞，返回距上次采样以来的使用率
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_freq = psutil.cpu_freq()
             info = {
-                "CPU核心数": psutil.cpu_count(logical=False),
-                "逻辑CPU数": psutil.cpu_count(logical=True),
-                "CPU使用率": f"{psutil.cpu_percent(interval=1):.2f}%",
-                "CPU频率": f"{psutil.cpu_freq().current:.2f} MHz" if psutil.cpu_freq() else "未知"
+                "CPU核心数": physical_count,
+                "逻辑CPU数": logical_count,
+                "CPU使用率": f"{cpu_percent:.2f}%",
+                "CPU频率": f"{cpu_freq.current:.2f} MHz" if cpu_freq else "未知"
             }
-            return json.dumps(info, ensure_ascii=False, indent=2)
+            return _dumps(info)
         except Exception as e:
             return f"获取CPU信息失败: {str(e)}"
     
@@ -298,7 +578,7 @@ class SystemInfoTools:
                 "已使用内存": f"{memory.used / (1024**3):.2f} GB",
                 "内存使用率": f"{memory.percent:.2f}%"
             }
-            return json.dumps(info, ensure_ascii=False, indent=2)
+            return _dumps(info)
         except Exception as e:
             return f"获取内存信息失败: {str(e)}"
     
@@ -306,23 +586,36 @@ class SystemInfoTools:
     def get_disk_info() -> str:
         """获取磁盘信息"""
         try:
+            partitions = psutil.disk_partitions()
+            if not partitions:
+                return _dumps([])
+            
+            # 各挂载点的 disk_usage 并发查询，慢速文件系统（如 NFS）不会逐个累加等待时间；
+            # 超时未返回的挂载点直接跳过，不等待其线程结束
+            executor = ThreadPoolExecutor(max_workers=min(_DISK_USAGE_MAX_WORKERS, len(partitions)))
+            try:
+                futures = [executor.submit(psutil.disk_usage, partition.mountpoint) for partition in partitions]
+                wait(futures, timeout=_DISK_USAGE_TIMEOUT)
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+            
             disk_info = []
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_info.append({
-                        "设备": partition.device,
-                        "挂载点": partition.mountpoint,
-                        "文件系统": partition.fstype,
-                        "总空间": f"{usage.total / (1024**3):.2f} GB",
-                        "已使用": f"{usage.used / (1024**3):.2f} GB",
-                        "可用空间": f"{usage.free / (1024**3):.2f} GB",
-                        "使用率": f"{(usage.used / usage.total * 100):.2f}%"
-                    })
-                except PermissionError:
+            for partition, future in zip(partitions, futures):
+                if not future.done() or future.cancelled() or future.exception() is not None:
                     continue
+                
+                usage = future.result()
+                disk_info.append({
+                    "设备": partition.device,
+                    "挂载点": partition.mountpoint,
+                    "文件系统": partition.fstype,
+                    "总空间": f"{usage.total / (1024**3):.2f} GB",
+                    "已使用": f"{usage.used / (1024**3):.2f} GB",
+                    "可用空间": f"{usage.free / (1024**3):.2f} GB",
+                    "使用率": f"{(usage.used / usage.total * 100):.2f}%"
+                })
             
-            return json.dumps(disk_info, ensure_ascii=False, indent=2)
+            return _dumps(disk_info)
         except Exception as e:
             return f"获取磁盘信息失败: {str(e)}"
     
@@ -330,21 +623,118 @@ class SystemInfoTools:
     def get_process_list(limit: int = 10) -> str:
         """获取进程列表"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # 按CPU使用率排序
-            processes.sort(key=lambda x: x['cpu_percent'] or 0, reverse=True)
+            _prime_cpu_percent()
+            # 只保留CPU使用率最高的 limit 个进程，无需对全部进程排序
+            processes = heapq.nlargest(
+                limit,
+                (proc.info for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent'])),
+                key=lambda x: x['cpu_percent'] or 0
+            )
             
-            return json.dumps(processes[:limit], ensure_ascii=False, indent=2)
+            return _dumps(processes)
         except Exception as e:
             return f"获取进程列表失败: {str(e)}"
 
 
+# basic_math 允许使用的名称，只在导入时构建一次
+_ALLOWED_NAMES = {
+    k: v for k, v in math.__dict__.items() if not k.startswith("__")
+}
+_ALLOWED_NAMES.update({"abs": abs, "round": round})
+
+# 不含名称的纯数值表达式直接按语法树求值，不经过 eval
+_MATH_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_MATH_UNARY_OPERATORS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_MATH_NODE_TYPES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    *_MATH_BINARY_OPERATORS, *_MATH_UNARY_OPERATORS,
+)
+
+
+def _eval_numeric(node):
+    """对已校验的纯数值语法树求值"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.BinOp):
+        return _MATH_BINARY_OPERATORS[type(node.op)](
+            _eval_numeric(node.left), _eval_numeric(node.right)
+        )
+    return _MATH_UNARY_OPERATORS[type(node.op)](_eval_numeric(node.operand))
+
+
+@lru_cache(maxsize=256)
+def _compile_math(expression: str):
+    """
+    解析并校验数学表达式，同一表达式只处理一次
+    
+    Args:
+        expression: 数学表达式
+        
+    Returns:
+        (代码对象, None)；纯数值表达式返回 (None, 计算结果)
+    """
+    tree = ast.parse(expression, mode='eval')
+    has_names = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float, complex):
+                raise ValueError(f"不支持的常量: {node.value!r}")
+        elif isinstance(node, ast.Name):
+            if node.id not in _ALLOWED_NAMES:
+                raise ValueError(f"不允许的名称: {node.id}")
+            has_names = True
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.keywords:
+                raise ValueError("只允许直接调用数学函数")
+        elif not isinstance(node, _MATH_NODE_TYPES):
+            raise ValueError(f"不支持的表达式: {type(node).__name__}")
+    
+    if not has_names:
+        return None, _eval_numeric(tree.body)
+    return compile(tree, '<basic_math>', 'eval'), None
+
+
+# statistics_calc 改用 NumPy 的最小列表长度；statistics.median 只是一次排序，
+# 列表较长时 NumPy 才更快。mode 保留 statistics 实现以维持并列时取首个出现值的语义
+_NUMPY_MIN_SIZES = {'mean': 64, 'stdev': 64, 'variance': 64, 'median': 1000}
+
+
+# unit_conversion 的换算表：长度以米、重量以千克为基础单位
+_UNIT_CONVERSIONS = {
+    'length': {
+        'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000,
+        'inch': 0.0254, 'ft': 0.3048, 'yard': 0.9144, 'mile': 1609.34
+    },
+    'weight': {
+        'mg': 0.000001, 'g': 0.001, 'kg': 1, 'ton': 1000,
+        'oz': 0.0283495, 'lb': 0.453592
+    }
+}
+
+# 温度单位与摄氏度之间的换算
+_TEMPERATURE_TO_CELSIUS = {
+    'celsius': lambda x: x,
+    'fahrenheit': lambda x: (x - 32) * 5/9,
+    'kelvin': lambda x: x - 273.15
+}
+_TEMPERATURE_FROM_CELSIUS = {
+    'celsius': lambda x: x,
+    'fahrenheit': lambda x: x * 9/5 + 32,
+    'kelvin': lambda x: x + 273.15
+}
+
+
 class CalculationTools:
     """计算工具集"""
     
@@ -352,13 +742,10 @@ class CalculationTools:
     def basic_math(expression: str) -> str:
         """基础数学计算"""
         try:
-            # 安全的数学表达式计算
-            allowed_names = {
-                k: v for k, v in math.__dict__.items() if not k.startswith("__")
-            }
-            allowed_names.update({"abs": abs, "round": round})
-            
-            result = eval(expression, {"__builtins__": {}}, allowed_names)
+            # 表达式经过语法树白名单校验，编译结果按表达式缓存
+            code, result = _compile_math(expression)
+            if code is not None:
+                result = eval(code, {"__builtins__": {}}, _ALLOWED_NAMES)
             return str(result)
         except Exception as e:
             return f"计算失败: {str(e)}"
@@ -370,6 +757,30 @@ class CalculationTools:
             if not numbers:
                 return "数字列表不能为空"
             
+            # 长列表改用 NumPy 向量化计算
+            min_size = _NUMPY_MIN_SIZES.get(operation)
+            if np is not None and min_size is not None and len(numbers) >= min_size:
+                all_int = all(type(x) is int for x in numbers)
+                # 整数列表的方差由 statistics 精确计算，float64 累加可能让整数结果带上尾差
+                if not (all_int and operation == 'variance'):
+                    arr = np.asarray(numbers, dtype=np.float64)
+                    if operation == 'mean':
+                        result = float(arr.mean())
+                    elif operation == 'median':
+                        result = float(np.median(arr))
+                    elif operation == 'stdev':
+                        result = float(arr.std(ddof=1))
+                    else:
+                        result = float(arr.var(ddof=1))
+                    # 与 statistics 的返回类型保持一致：整数列表的均值为整数时、
+                    # 奇数长度的中位数返回 int，避免两条路径输出 "2" 与 "2.0" 的差异
+                    if all_int and (
+                        (operation == 'mean' and result.is_integer())
+                        or (operation == 'median' and len(numbers) % 2 == 1)
+                    ):
+                        result = int(result)
+                    return str(result)
+            
             if operation == 'mean':
                 result = statistics.mean(numbers)
             elif operation == 'median':
@@ -397,46 +808,19 @@ class CalculationTools:
     def unit_conversion(value: float, from_unit: str, to_unit: str, unit_type: str = 'length') -> str:
         """单位转换"""
         try:
-            conversions = {
-                'length': {
-                    'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000,
-                    'inch': 0.0254, 'ft': 0.3048, 'yard': 0.9144, 'mile': 1609.34
-                },
-                'weight': {
-                    'mg': 0.000001, 'g': 0.001, 'kg': 1, 'ton': 1000,
-                    'oz': 0.0283495, 'lb': 0.453592
-                },
-                'temperature': {
-                    'celsius': lambda x: x,
-                    'fahrenheit': lambda x: (x - 32) * 5/9,
-                    'kelvin': lambda x: x - 273.15
-                }
-            }
-            
             if unit_type == 'temperature':
-                # 温度转换需要特殊处理
-                if from_unit == 'celsius':
-                    celsius_value = value
-                elif from_unit == 'fahrenheit':
-                    celsius_value = (value - 32) * 5/9
-                elif from_unit == 'kelvin':
-                    celsius_value = value - 273.15
-                else:
+                # 温度转换需要特殊处理：先转换为摄氏度，再转换为目标单位
+                if from_unit not in _TEMPERATURE_TO_CELSIUS:
                     return f"不支持的温度单位: {from_unit}"
-                
-                if to_unit == 'celsius':
-                    result = celsius_value
-                elif to_unit == 'fahrenheit':
-                    result = celsius_value * 9/5 + 32
-                elif to_unit == 'kelvin':
-                    result = celsius_value + 273.15
-                else:
+                if to_unit not in _TEMPERATURE_FROM_CELSIUS:
                     return f"不支持的温度单位: {to_unit}"
+                
+                result = _TEMPERATURE_FROM_CELSIUS[to_unit](_TEMPERATURE_TO_CELSIUS[from_unit](value))
             else:
-                if unit_type not in conversions:
+                unit_dict = _UNIT_CONVERSIONS.get(unit_type)
+                if unit_dict is None:
                     return f"不支持的单位类型: {unit_type}"
                 
-                unit_dict = conversions[unit_type]
                 if from_unit not in unit_dict or to_unit not in unit_dict:
                     return f"不支持的单位: {from_unit} 或 {to_unit}"
                 
@@ -449,6 +833,25 @@ class CalculationTools:
             return f"单位转换失败: {str(e)}"
 
 
+# 文本分析用到的正则在导入时编译
+_SENT_RE = re.compile(r'[.!?]+')
+
+# 用户传入的正则按模式缓存编译结果
+_compile_pattern = lru_cache(maxsize=128)(re.compile)
+
+# text_hash 支持的算法与分块大小（按字符计）
+_HASH_ALGORITHMS = frozenset({'md5', 'sha1', 'sha256', 'blake2b'})
+_HASH_CHUNK_SIZE = 64 * 1024
+# 只缓存不超过 1K 字符的短文本，缓存最多占用约 256 * 1K 字符
+_HASH_CACHE_MAX_CHARS = 1024
+
+
+@lru_cache(maxsize=256)
+def _hash_short_text(text: str, algorithm: str) -> str:
+    """短文本的哈希结果按 (文本, 算法) 缓存，较长文本不缓存以免缓存键常驻内存"""
+    return hashlib.new(algorithm, text.encode('utf-8')).hexdigest()
+
+
 class TextProcessingTools:
     """文本处理工具集"""
     
@@ -457,20 +860,29 @@ class TextProcessingTools:
         """文本分析"""
         try:
             words = text.split()
-            sentences = re.split(r'[.!?]+', text)
+            sentences = _SENT_RE.split(text)
             paragraphs = text.split('\n\n')
             
+            # 单词长度只计算一次，之后的统计都在整数列表上完成
+            lengths = list(map(len, words))
+            if words:
+                average_length = sum(lengths) / len(words)
+                longest = words[lengths.index(max(lengths))]
+                shortest = words[lengths.index(min(lengths))]
+            else:
+                average_length, longest, shortest = 0, "", ""
+            
             analysis = {
                 "字符数": len(text),
                 "单词数": len(words),
                 "句子数": len([s for s in sentences if s.strip()]),
                 "段落数": len([p for p in paragraphs if p.strip()]),
-                "平均单词长度": sum(len(word) for word in words) / len(words) if words else 0,
-                "最长单词": max(words, key=len) if words else "",
-                "最短单词": min(words, key=len) if words else ""
+                "平均单词长度": average_length,
+                "最长单词": longest,
+                "最短单词": shortest
             }
             
-            return json.dumps(analysis, ensure_ascii=False, indent=2)
+            return _dumps(analysis)
         except Exception as e:
             return f"文本分析失败: {str(e)}"
     
@@ -479,7 +891,7 @@ class TextProcessingTools:
         """文本搜索替换"""
         try:
             if use_regex:
-                result = re.sub(search_pattern, replacement, text)
+                result = _compile_pattern(search_pattern).sub(replacement, text)
             else:
                 result = text.replace(search_pattern, replacement)
             
@@ -491,25 +903,28 @@ class TextProcessingTools:
     def text_extract_pattern(text: str, pattern: str) -> str:
         """提取文本模式"""
         try:
-            matches = re.findall(pattern, text)
-            return json.dumps(matches, ensure_ascii=False, indent=2)
+            matches = _compile_pattern(pattern).findall(text)
+            return _dumps(matches)
         except Exception as e:
             return f"模式提取失败: {str(e)}"
     
     @staticmethod
-    def text_hash(text: str, algorithm: str = 'md5') -> str:
+    def text_hash(text: Union[str, bytes], algorithm: str = 'blake2b') -> str:
         """计算文本哈希"""
         try:
-            text_bytes = text.encode('utf-8')
+            if algorithm not in _HASH_ALGORITHMS:
+                return f"不支持的哈希算法: {algorithm}"
             
-            if algorithm == 'md5':
-                hash_obj = hashlib.md5(text_bytes)
-            elif algorithm == 'sha1':
-                hash_obj = hashlib.sha1(text_bytes)
-            elif algorithm == 'sha256':
-                hash_obj = hashlib.sha256(text_bytes)
+            if isinstance(text, str) and len(text) <= _HASH_CACHE_MAX_CHARS:
+                return _hash_short_text(text, algorithm)
+            
+            hash_obj = hashlib.new(algorithm)
+            if isinstance(text, bytes):
+                hash_obj.update(text)
             else:
-                return f"不支持的哈希算法: {algorithm}"
+                # 分块编码后送入哈希对象，避免一次性复制整段文本
+                for start in range(0, len(text), _HASH_CHUNK_SIZE):
+                    hash_obj.update(text[start:start + _HASH_CHUNK_SIZE].encode('utf-8'))
             
             return hash_obj.hexdigest()
         except Exception as e:
@@ -542,7 +957,12 @@ class PredefinedToolsRegistry:
     
     @staticmethod
     def get_all_tools() -> List[ToolDefinition]:
-        """获取所有预定义工具"""
+        """获取所有预定义工具（返回列表副本，工具定义本身在导入时只构建一次）"""
+        return list(_ALL_TOOLS)
+    
+    @staticmethod
+    def _build_tools() -> List[ToolDefinition]:
+        """构建所有预定义工具定义"""
         tools = []
         
         # 文件操作工具
@@ -553,7 +973,8 @@ class PredefinedToolsRegistry:
                 function=FileOperationTools.read_file,
                 parameters=[
                     ToolParameter("file_path", "string", "文件路径", True),
-                    ToolParameter("encoding", "string", "文件编码", False, "utf-8")
+                    ToolParameter("encoding", "string", "文件编码", False, "utf-8"),
+                    ToolParameter("max_bytes", "integer", "最多读取的字节数", False, None)
                 ],
                 tool_type=ToolType.FILE_OPERATION,
                 examples=["读取config.txt文件", "查看日志文件内容"],
@@ -572,6 +993,18 @@ class PredefinedToolsRegistry:
                 examples=["保存配置到文件", "创建新的文本文件"],
                 tags=["文件", "写入", "保存"]
             ),
+            ToolDefinition(
+                name="copy_file",
+                description="复制文件",
+                function=FileOperationTools.copy_file,
+                parameters=[
+                    ToolParameter("src_path", "string", "源文件路径", True),
+                    ToolParameter("dst_path", "string", "目标文件路径", True)
+                ],
+                tool_type=ToolType.FILE_OPERATION,
+                examples=["备份配置文件", "复制日志文件到指定目录"],
+                tags=["文件", "复制", "备份"]
+            ),
             ToolDefinition(
                 name="list_directory",
                 description="列出目录内容",
@@ -606,12 +1039,27 @@ class PredefinedToolsRegistry:
                 parameters=[
                     ToolParameter("url", "string", "请求URL", True),
                     ToolParameter("headers", "object", "请求头", False, None),
-                    ToolParameter("timeout", "integer", "超时时间(秒)", False, 30)
+                    ToolParameter("timeout", "integer", "超时时间(秒)", False, 30),
+                    ToolParameter("pretty", "boolean", "是否缩进输出JSON", False, False)
                 ],
                 tool_type=ToolType.NETWORK_REQUEST,
                 examples=["获取API数据", "检查网站状态"],
                 tags=["HTTP", "GET", "网络"]
             ),
+            ToolDefinition(
+                name="http_get_many",
+                description="并发发送多个HTTP GET请求",
+                function=NetworkTools.http_get_many,
+                parameters=[
+                    ToolParameter("urls", "array", "请求URL列表", True),
+                    ToolParameter("headers", "object", "请求头", False, None),
+                    ToolParameter("timeout", "integer", "超时时间(秒)", False, 30)
+                ],
+                tool_type=ToolType.NETWORK_REQUEST,
+                examples=["同时获取多个API数据", "批量检查网站状态"],
+                tags=["HTTP", "GET", "并发", "网络"],
+                async_support=True
+            ),
             ToolDefinition(
                 name="http_post",
                 description="发送HTTP POST请求",
@@ -621,7 +1069,8 @@ class PredefinedToolsRegistry:
                     ToolParameter("data", "object", "表单数据", False, None),
                     ToolParameter("json_data", "object", "JSON数据", False, None),
                     ToolParameter("headers", "object", "请求头", False, None),
-                    ToolParameter("timeout", "integer", "超时时间(秒)", False, 30)
+                    ToolParameter("timeout", "integer", "超时时间(秒)", False, 30),
+                    ToolParameter("pretty", "boolean", "是否缩进输出JSON", False, False)
                 ],
                 tool_type=ToolType.NETWORK_REQUEST,
                 examples=["提交表单数据", "调用API接口"],
@@ -788,7 +1237,7 @@ class PredefinedToolsRegistry:
                 function=TextProcessingTools.text_hash,
                 parameters=[
                     ToolParameter("text", "string", "要计算哈希的文本", True),
-                    ToolParameter("algorithm", "string", "哈希算法(md5/sha1/sha256)", False, "md5")
+                    ToolParameter("algorithm", "string", "哈希算法(blake2b/sha256/sha1/md5)，sha256 在支持 SHA-NI 的 CPU 上由硬件加速", False, "blake2b")
                 ],
                 tool_type=ToolType.TEXT_PROCESSING,
                 examples=["生成文件校验码", "计算密码哈希"],
@@ -806,3 +1255,6 @@ class PredefinedToolsRegistry:
             agent.register_tool(tool)
         
         print(f"✅ 已注册 {len(tools)} 个预定义工具")
+
+
+_ALL_TOOLS: List[ToolDefinition] = PredefinedToolsRegistry._build_tools()
@@ -4,16 +4,21 @@ Web 应用服务
 提供 FastAPI 服务来支持前端界面与 Agent 交互
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 import os
 import json
+import asyncio
+import orjson
 import re
 import hashlib
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 from langchain_core.messages import HumanMessage
 
@@ -91,31 +96,68 @@ from .tools.basic_tools import get_basic_tools
 from .config import settings
 from .gitee_ai_client import GiteeAIClient
 from .database_helper import DatabaseHelper
+from .session_store import create_session_store
+from .response_cache import create_response_cache
 
 # RAG Agent 延迟导入，避免阻塞启动
 # 使用 TYPE_CHECKING 来支持类型注解而不影响运行时
 if TYPE_CHECKING:
     from .rag.rag_agent import RAGAgent
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：启动时初始化并预热，关闭时释放资源"""
+    await startup_event()
+    warm_up_task = _warm_up()
+    yield
+    if warm_up_task is not None:
+        warm_up_task.cancel()
+    if settings.gitee_ai_api_key:
+        await get_gitee_client().aclose()
+    await shutdown_event()
+
+
 # 创建 FastAPI 应用
 app = FastAPI(
     title="ShuYixiao Agent Web Interface",
     description="基于 LangGraph 和码云 AI 的智能 Agent Web 界面",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # 添加 CORS 中间件
+# 使用明确的来源、方法和请求头白名单，并让浏览器缓存预检结果 24 小时，
+# 避免每个非简单请求都多一次 OPTIONS 往返
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 生产环境应该设置具体的域名
+    allow_origins=settings.cors_origins,  # 通过 CORS_ORIGINS 配置
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
+# 压缩较大的响应（如会话历史、前端页面）；text/event-stream 流式响应
+# 会被 GZipMiddleware 自动跳过，不影响逐块推送（Starlette 0.46 起支持，
+# 依赖中已约束 starlette>=0.46.0，更早的版本会压缩并缓冲 SSE）。
+# 压缩级别 6 与默认的 9 压缩率几乎相同（index.html: 43.6KB vs 42.7KB），
+# 耗时却只有约 1/3（3.4ms vs 12ms）
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
-# 启动和关闭事件
-@app.on_event("startup")
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    """
+    未处理异常的统一出口
+    
+    返回固定的 500 响应，不把内部异常信息暴露给客户端；
+    完整的异常堆栈由 uvicorn 记录，这里只打印一行摘要。
+    """
+    print(f"[错误] {request.method} {request.url.path} 处理失败: {type(exc).__name__}: {exc}")
+    return JSONResponse({"detail": "服务器内部错误"}, status_code=500)
+
+
+# 启动和关闭事件（由 lifespan 调用）
 async def startup_event():
     """应用启动事件"""
     print("=" * 60)
@@ -201,13 +243,37 @@ async def startup_event():
     print("=" * 60)
 
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """应用关闭事件"""
     print("👋 ShuYixiao Agent Web 应用已关闭")
 
-# Agent 实例缓存
-agents: Dict[str, Any] = {}
+
+def _warm_up() -> Optional[asyncio.Task]:
+    """
+    预热默认的 simple / tool Agent 和到码云 AI 的连接，避免第一个请求承担冷启动开销
+    
+    Returns:
+        后台建立连接的任务，未配置 API Key 或预热失败时返回 None
+    """
+    if not settings.gitee_ai_api_key:
+        return None
+    try:
+        get_agent("simple")
+        get_agent("tool")
+        client = get_gitee_client()
+    except Exception as e:
+        print(f"⚠️  预热默认 Agent 失败: {e}")
+        return None
+    print("✅ 默认 Agent 已预热")
+    
+    async def connect():
+        """在后台建立连接，网络不可用时不影响启动"""
+        try:
+            await client.awarm_up()
+        except Exception as e:
+            print(f"⚠️  预先建立 API 连接失败: {e}")
+    
+    return asyncio.create_task(connect())
 
 # RAG Agent 实例缓存
 rag_agents: Dict[str, Any] = {}
@@ -227,8 +293,11 @@ reflection_agent: Optional[ReflectionAgent] = None
 # Memory Agent 实例缓存
 memory_agents: Dict[str, MemoryAgent] = {}
 
-# 会话消息历史（简单实现，生产环境应使用数据库）
-session_histories: Dict[str, List[Dict[str, str]]] = {}
+# 会话消息历史（配置 REDIS_URL 时存储在 Redis 中，否则保存在进程内存中）
+session_store = create_session_store()
+
+# /api/chat 响应缓存（仅在配置 REDIS_URL 时启用，否则为 None）
+response_cache = create_response_cache()
 
 # 知识库名称映射（原始名称 -> 合法名称）
 collection_name_mapping: Dict[str, str] = {}
@@ -301,15 +370,20 @@ def normalize_collection_name(name: str) -> str:
 
 class ChatRequest(BaseModel):
     """聊天请求模型"""
+    # 拒绝未知字段和超长文本（消息会被哈希、发送给大模型并写入会话历史）
+    model_config = ConfigDict(extra="forbid", frozen=True, str_max_length=32768)
+    
     message: str
     agent_type: str = "simple"  # simple, tool, rag, 或 prompt_chaining
-    session_id: Optional[str] = "default"
+    session_id: str = "default"
     system_message: Optional[str] = None
     collection_name: Optional[str] = "default"  # RAG 专用：知识库集合名
 
 
 class ChatResponse(BaseModel):
     """聊天响应模型"""
+    model_config = ConfigDict(frozen=True)
+    
     response: str
     agent_type: str
     session_id: str
@@ -317,10 +391,25 @@ class ChatResponse(BaseModel):
 
 class SessionHistoryResponse(BaseModel):
     """会话历史响应模型"""
+    model_config = ConfigDict(frozen=True)
+    
     session_id: str
     messages: List[Dict[str, str]]
 
 
+class ClearHistoryResponse(BaseModel):
+    """清除会话历史响应模型"""
+    message: str
+    session_id: str
+
+
+class HealthResponse(BaseModel):
+    """健康检查响应模型"""
+    status: str
+    api_key_configured: bool
+    model: str
+
+
 class DocumentUploadRequest(BaseModel):
     """文档上传请求模型"""
     file_path: str
@@ -420,49 +509,107 @@ class PlanExecutionRequest(BaseModel):
     plan_id: str
 
 
+# 各模式的默认系统消息
+_DEFAULT_SIMPLE_SYS = "你是一个有帮助的AI助手，请友好、专业地回答用户的问题。"
+_DEFAULT_TOOL_SYS = "你是一个有帮助的AI助手。你可以使用提供的工具来完成任务。"
+
+def _create_agent(agent_type: str, system_message: str):
+    """
+    创建 Agent 实例
+
+    Args:
+        agent_type: Agent 类型
+        system_message: 系统消息，空字符串表示使用默认值（tool_use、planning 不使用）
+
+    Returns:
+        Agent 实例
+    """
+    if agent_type == "simple":
+        return SimpleAgent(
+            system_message=system_message or _DEFAULT_SIMPLE_SYS
+        )
+    elif agent_type == "tool":
+        agent = ToolAgent(
+            system_message=system_message or _DEFAULT_TOOL_SYS
+        )
+        # 注册基础工具
+        for tool_info in get_basic_tools():
+            agent.register_tool(
+                name=tool_info["name"],
+                func=tool_info["func"],
+                description=tool_info["description"],
+                parameters=tool_info["parameters"]
+            )
+        return agent
+    elif agent_type == "tool_use":
+        agent = ToolUseAgent(
+            llm_client=GiteeAIClient(),
+            verbose=True
+        )
+        # 注册所有预定义工具
+        PredefinedToolsRegistry.register_all_tools(agent)
+        return agent
+    elif agent_type == "planning":
+        agent = PlanningAgent(
+            llm_client=GiteeAIClient(),
+            strategy=PlanningStrategy.ADAPTIVE,
+            verbose=True
+        )
+        # 注册所有预定义的任务处理器
+        PlanningTaskHandlers.register_all_handlers(agent)
+        return agent
+    else:
+        raise ValueError(f"未知的 agent 类型: {agent_type}")
+
+
+@lru_cache(maxsize=1)
+def get_gitee_client() -> GiteeAIClient:
+    """
+    获取共享的码云 AI 客户端
+    
+    所有流式对话请求复用同一个客户端及其连接池（HTTP keep-alive），
+    不必每个请求都重新建立 TLS 连接。首次使用时才创建，
+    未配置 API Key 时抛出的异常不会被缓存。
+    
+    Returns:
+        GiteeAIClient 实例
+    """
+    return GiteeAIClient()
+
+
+# 默认 Agent 以及有状态的 tool_use / planning Agent（保存计划等数据），按类型缓存，不会被淘汰
+agents: Dict[str, Any] = {}
+
+# 调用方自定义 system_message 的 simple / tool Agent 最多缓存的实例数，超出时按 LRU 淘汰
+_CUSTOM_AGENT_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=_CUSTOM_AGENT_CACHE_SIZE)
+def _build_custom_agent(agent_type: str, sys_hash: bytes, system_message: str):
+    """
+    创建使用自定义系统消息的 simple / tool Agent（按 agent_type 和 system_message 摘要做 LRU 缓存）
+
+    Args:
+        agent_type: Agent 类型，simple 或 tool
+        sys_hash: system_message 的摘要，仅用于区分缓存条目
+        system_message: 系统消息
+
+    Returns:
+        Agent 实例
+    """
+    return _create_agent(agent_type, system_message)
+
+
 def get_agent(agent_type: str, system_message: Optional[str] = None):
     """获取或创建 Agent 实例"""
-    cache_key = f"{agent_type}_{system_message or 'default'}"
-    
-    if cache_key not in agents:
-        if agent_type == "simple":
-            agents[cache_key] = SimpleAgent(
-                system_message=system_message or "你是一个有帮助的AI助手，请友好、专业地回答用户的问题。"
-            )
-        elif agent_type == "tool":
-            agent = ToolAgent(
-                system_message=system_message or "你是一个有帮助的AI助手。你可以使用提供的工具来完成任务。"
-            )
-            # 注册基础工具
-            for tool_info in get_basic_tools():
-                agent.register_tool(
-                    name=tool_info["name"],
-                    func=tool_info["func"],
-                    description=tool_info["description"],
-                    parameters=tool_info["parameters"]
-                )
-            agents[cache_key] = agent
-        elif agent_type == "tool_use":
-            agent = ToolUseAgent(
-                llm_client=GiteeAIClient(),
-                verbose=True
-            )
-            # 注册所有预定义工具
-            PredefinedToolsRegistry.register_all_tools(agent)
-            agents[cache_key] = agent
-        elif agent_type == "planning":
-            agent = PlanningAgent(
-                llm_client=GiteeAIClient(),
-                strategy=PlanningStrategy.ADAPTIVE,
-                verbose=True
-            )
-            # 注册所有预定义的任务处理器
-            PlanningTaskHandlers.register_all_handlers(agent)
-            agents[cache_key] = agent
-        else:
-            raise ValueError(f"未知的 agent 类型: {agent_type}")
+    if system_message and agent_type in ("simple", "tool"):
+        sys_hash = hashlib.blake2b(system_message.encode("utf-8"), digest_size=16).digest()
+        return _build_custom_agent(agent_type, sys_hash, system_message)
     
-    return agents[cache_key]
+    agent = agents.get(agent_type)
+    if agent is None:
+        agent = agents[agent_type] = _create_agent(agent_type, "")
+    return agent
 
 
 def get_rag_agent(collection_name: str = "default"):
@@ -585,140 +732,209 @@ def get_memory_agent(session_id: str = "default", max_memories: int = 1000):
     return memory_agents[cache_key]
 
 
-@app.get("/", response_class=HTMLResponse)
-async def read_root():
-    """返回前端 HTML 页面"""
-    print(f"[请求] GET / - 返回主页")
-    
-    static_dir = Path(__file__).parent / "static"
-    html_file = static_dir / "index.html"
-    
-    print(f"[信息] 静态文件目录: {static_dir}")
-    print(f"[信息] HTML 文件路径: {html_file}")
-    print(f"[信息] 文件存在: {html_file.exists()}")
-    
-    if html_file.exists():
-        content = html_file.read_text(encoding="utf-8")
-        print(f"[成功] 返回 HTML 文件, 大小: {len(content)} 字符")
-        return HTMLResponse(content=content)
-    else:
-        print(f"[警告] HTML 文件不存在: {html_file}")
-        return HTMLResponse(content="""
+_FALLBACK_HTML = """
         <html>
             <body>
                 <h1>前端页面未找到</h1>
                 <p>请确保 static/index.html 文件存在</p>
             </body>
         </html>
-        """)
+        """
+
+
+def _load_index_html():
+    """
+    启动时读取前端页面，之后每次请求直接返回内存中的内容
+
+    Returns:
+        index.html 的字节内容，文件不存在时返回提示页面
+    """
+    html_file = Path(__file__).parent / "static" / "index.html"
+    if html_file.exists():
+        content = html_file.read_bytes()
+        print(f"[信息] 已加载 HTML 文件: {html_file}, 大小: {len(content)} 字节")
+        return content
+    print(f"[警告] HTML 文件不存在: {html_file}")
+    return _FALLBACK_HTML
+
+
+_INDEX_HTML = _load_index_html()
+
+
+@app.get("/", response_class=HTMLResponse)
+async def read_root():
+    """返回前端 HTML 页面"""
+    return HTMLResponse(content=_INDEX_HTML)
 
 
 @app.post("/api/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """处理聊天请求（非流式）"""
-    try:
+async def chat(request: ChatRequest, nocache: bool = False):
+    """
+    处理聊天请求（非流式）
+    
+    配置了 Redis 时，simple agent 相同的系统消息和用户消息会在缓存有效期内
+    直接返回缓存的回复；调试时可以加上 ?nocache=1 跳过缓存。会调用工具的
+    agent 不缓存，工具结果（当前时间、随机数、系统信息等）每次都可能不同。
+    """
+    sid = request.session_id
+    message = request.message
+    # 出错时异常直接抛出，由全局异常处理器统一返回 500
+    
+    # 添加用户消息到历史
+    await session_store.append(sid, {"role": "user", "content": message})
+    
+    use_cache = (
+        response_cache is not None
+        and not nocache
+        and request.agent_type == "simple"
+    )
+    response = None
+    if use_cache:
+        cache_key = response_cache.make_key(request.agent_type, request.system_message, message)
+        response = await response_cache.get(cache_key)
+    
+    if response is None:
         # 获取 Agent
         agent = get_agent(request.agent_type, request.system_message)
         
-        # 初始化会话历史
-        if request.session_id not in session_histories:
-            session_histories[request.session_id] = []
-        
-        # 添加用户消息到历史
-        session_histories[request.session_id].append({
-            "role": "user",
-            "content": request.message
-        })
-        
-        # 调用 Agent
+        # 调用 Agent（同步的 LLM 调用放到线程池执行，避免阻塞事件循环）
         if request.agent_type == "simple":
-            response = agent.chat(request.message)
+            response = await asyncio.to_thread(agent.chat, message)
         else:  # tool agent
-            response = agent.run(request.message)
-        
-        # 添加 AI 回复到历史
-        session_histories[request.session_id].append({
-            "role": "assistant",
-            "content": response
-        })
-        
-        return ChatResponse(
-            response=response,
-            agent_type=request.agent_type,
-            session_id=request.session_id
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"处理请求时出错: {str(e)}")
+            response = await asyncio.to_thread(agent.run, message)
+        
+        if use_cache:
+            await response_cache.set(cache_key, response)
+    
+    # 添加 AI 回复到历史
+    await session_store.append(sid, {"role": "assistant", "content": response})
+    
+    return ChatResponse(
+        response=response,
+        agent_type=request.agent_type,
+        session_id=sid
+    )
+
+
+# SSE 帧的固定前后缀，数据部分用 orjson 直接编码为 bytes
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_DONE_FRAME = _SSE_PREFIX + orjson.dumps({"content": "", "done": True}) + _SSE_SUFFIX
+# 出错时的结束帧，具体异常只打印在服务端
+_ERROR_FRAME = _SSE_PREFIX + orjson.dumps({"error": "处理请求时出错", "done": True}) + _SSE_SUFFIX
+
+# 流式响应中上游数据块的缓冲队列长度
+_STREAM_QUEUE_SIZE = 64
+
+# 合并为一个 SSE 帧的最大字符数
+_STREAM_COALESCE_CHARS = 256
 
 
 @app.post("/api/chat/stream")
 async def chat_stream(request: ChatRequest):
     """处理聊天请求（流式）"""
+    sid = request.session_id
+    message = request.message
+    system_message = request.system_message or _DEFAULT_SIMPLE_SYS
     
     async def generate():
+        stream = None
+        producer = None
+        full_response = ""
         try:
-            # 初始化会话历史
-            if request.session_id not in session_histories:
-                session_histories[request.session_id] = []
-            
             # 添加用户消息到历史
-            session_histories[request.session_id].append({
-                "role": "user",
-                "content": request.message
-            })
-            
-            # 构建消息历史
-            messages = []
-            
-            # 添加系统消息
-            system_message = request.system_message or "你是一个有帮助的AI助手，请友好、专业地回答用户的问题。"
-            messages.append({
-                "role": "system",
-                "content": system_message
-            })
+            await session_store.append(sid, {"role": "user", "content": message})
             
-            # 添加历史消息（最近10条）
-            recent_history = session_histories[request.session_id][-10:]
-            messages.extend(recent_history)
+            # 构建消息历史：系统消息 + 最近10条历史消息
+            # 每次请求重新构建：系统消息可能随请求变化，使用 Redis 时历史由多个
+            # worker 共同写入，进程内缓存的消息列表会与实际历史不一致；
+            # 构建 11 条消息的列表本身耗时不到 1 微秒
+            messages = [{"role": "system", "content": system_message}]
+            messages.extend(await session_store.recent(sid, 10))
             
-            # 创建客户端并调用流式API
-            client = GiteeAIClient()
-            full_response = ""
+            # 复用共享客户端调用流式API
+            client = get_gitee_client()
             
             # 对于工具调用模式，暂时使用非流式（因为需要处理工具调用）
             if request.agent_type == "tool":
                 agent = get_agent(request.agent_type, request.system_message)
-                response = agent.run(request.message)
+                response = await asyncio.to_thread(agent.run, message)
                 full_response = response
                 
                 # 一次性发送
-                yield f"data: {json.dumps({'content': response, 'done': True}, ensure_ascii=False)}\n\n"
+                yield _SSE_PREFIX + orjson.dumps({"content": response, "done": True}) + _SSE_SUFFIX
             else:
-                # 简单对话模式使用流式
-                stream = client.chat_completion(messages=messages, stream=True)
+                # 简单对话模式使用异步流式接口，读取响应时不阻塞事件循环
+                stream = client.achat_completion_stream(messages=messages)
                 
-                for chunk in stream:
-                    if "choices" in chunk and len(chunk["choices"]) > 0:
-                        delta = chunk["choices"][0].get("delta", {})
-                        content = delta.get("content", "")
+                # 读取上游和发送给客户端通过有界队列解耦：客户端写入慢时上游读取
+                # 可以先行最多 _STREAM_QUEUE_SIZE 个数据块，反之亦然
+                queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+                
+                async def produce():
+                    """读取上游数据块放入队列，结束时放入 None，出错时放入异常"""
+                    try:
+                        async for chunk in stream:
+                            if "choices" in chunk and len(chunk["choices"]) > 0:
+                                delta = chunk["choices"][0].get("delta", {})
+                                content = delta.get("content", "")
+                                
+                                if content:
+                                    await queue.put(content)
+                    except Exception as e:
+                        await queue.put(e)
+                    else:
+                        await queue.put(None)
+                
+                producer = asyncio.create_task(produce())
+                try:
+                    finished = False
+                    while not finished:
+                        item = await queue.get()
+                        # 把队列中已经到达的数据块合并成一帧（最多约 _STREAM_COALESCE_CHARS
+                        # 个字符），上游比客户端快时减少 JSON 编码和网络写入次数
+                        parts = []
+                        size = 0
+                        while True:
+                            if item is None or isinstance(item, Exception):
+                                finished = True
+                                break
+                            parts.append(item)
+                            size += len(item)
+                            if size >= _STREAM_COALESCE_CHARS or queue.empty():
+                                break
+                            item = queue.get_nowait()
                         
-                        if content:
+                        if parts:
+                            content = "".join(parts)
                             full_response += content
                             # 发送数据块
-                            yield f"data: {json.dumps({'content': content, 'done': False}, ensure_ascii=False)}\n\n"
+                            yield _SSE_PREFIX + orjson.dumps({"content": content, "done": False}) + _SSE_SUFFIX
+                        if isinstance(item, Exception):
+                            raise item
+                finally:
+                    # 客户端断开或出错时停止读取上游，并等待生产者真正退出：
+                    # 它仍挂起在 stream 的 __anext__ 中时无法 aclose 上游流
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
                 
                 # 发送完成信号
-                yield f"data: {json.dumps({'content': '', 'done': True}, ensure_ascii=False)}\n\n"
-            
-            # 添加完整回复到历史
-            session_histories[request.session_id].append({
-                "role": "assistant",
-                "content": full_response
-            })
+                yield _DONE_FRAME
             
         except Exception as e:
-            error_msg = f"处理请求时出错: {str(e)}"
-            yield f"data: {json.dumps({'error': error_msg, 'done': True}, ensure_ascii=False)}\n\n"
+            print(f"[错误] 流式对话处理失败: {type(e).__name__}: {e}")
+            yield _ERROR_FRAME
+        finally:
+            # 无论正常结束、出错还是客户端中途断开，都保存已生成的回复并关闭上游流
+            if full_response:
+                # 断开时所在任务可能已被取消，shield 保证历史写入能够完成
+                await asyncio.shield(
+                    session_store.append(sid, {"role": "assistant", "content": full_response})
+                )
+            # 生产者仍在运行（等待它退出时本任务再次被取消）时，由生产者被取消时
+            # 自行结束上游流，这里关闭会抛出 "already running"
+            if stream is not None and (producer is None or producer.done()):
+                await stream.aclose()
     
     return StreamingResponse(
         generate(),
@@ -734,24 +950,20 @@ async def chat_stream(request: ChatRequest):
 @app.get("/api/history/{session_id}", response_model=SessionHistoryResponse)
 async def get_history(session_id: str):
     """获取会话历史"""
-    if session_id not in session_histories:
-        session_histories[session_id] = []
-    
     return SessionHistoryResponse(
         session_id=session_id,
-        messages=session_histories[session_id]
+        messages=await session_store.get(session_id)
     )
 
 
-@app.delete("/api/history/{session_id}")
+@app.delete("/api/history/{session_id}", response_model=ClearHistoryResponse)
 async def clear_history(session_id: str):
     """清除会话历史"""
-    if session_id in session_histories:
-        session_histories[session_id] = []
-    return {"message": "历史已清除", "session_id": session_id}
+    await session_store.clear(session_id)
+    return ClearHistoryResponse(message="历史已清除", session_id=session_id)
 
 
-@app.get("/api/health")
+@app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """健康检查接口"""
     print(f"[请求] GET /api/health - 健康检查")
@@ -3275,11 +3487,27 @@ async def export_memories(session_id: str, memory_types: Optional[List[str]] = N
 
 if __name__ == "__main__":
     import uvicorn
-    import asyncio
+    
+    # 默认单 worker：规划 Agent 的计划、RAG / Memory / Routing Agent、知识库名称映射等
+    # 都保存在进程内存中，多个 worker 之间互不共享，请求落到不同 worker 会找不到之前的数据。
+    # 只有配置了 REDIS_URL（会话历史共享）时才允许通过 UVICORN_WORKERS 启用多个 worker，
+    # 且只适合只使用 /api/chat 等无状态接口的部署。
+    # 开发时设置 DEV=1 启用热重载（reload 与多 worker 不能同时使用）
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    if workers > 1 and not settings.redis_url:
+        print("⚠️  未配置 REDIS_URL，不支持多个 worker（进程内的会话和 Agent 状态无法共享），已改为 1 个 worker")
+        workers = 1
+    elif workers > 1:
+        print(f"⚠️  使用 {workers} 个 worker：仅会话历史通过 Redis 共享，"
+              "规划、记忆、RAG 等 Agent 的状态仍然只在各自进程内有效")
+    reload = workers == 1 and bool(os.getenv("DEV"))
+    
     uvicorn.run(
         "shuyixiao_agent.web_app:app",
         host="0.0.0.0",
         port=8001,
-        reload=True
+        workers=workers,
+        reload=reload,
+        log_level="warning"
     )
 
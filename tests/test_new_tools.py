@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 # 直接导入工具模块
 from src.shuyixiao_agent.tools.basic_tools import (
+    calculate,
     get_random_number,
     convert_temperature,
     string_reverse,
@@ -23,6 +24,40 @@ from src.shuyixiao_agent.tools.basic_tools import (
     decode_base64,
     check_prime
 )
+from src.shuyixiao_agent.tools import predefined_tools
+from src.shuyixiao_agent.tools.predefined_tools import CalculationTools, DataProcessingTools
+from src.shuyixiao_agent.tools.ai_powered_tools import text_quality_analyzer
+
+
+def test_calculate():
+    """测试数学表达式计算"""
+    print("测试 calculate...")
+    
+    result = calculate("2 + 3 * 4")
+    assert result == 14.0, f"'2 + 3 * 4'应为14.0，但得到{result}"
+    print(f"  ✓ 2 + 3 * 4 = {result}")
+    
+    result = calculate("-(1 + 2) / 4")
+    assert result == -0.75, f"'-(1 + 2) / 4'应为-0.75，但得到{result}"
+    print(f"  ✓ -(1 + 2) / 4 = {result}")
+    
+    # 结果不大的幂运算正常计算，不受指数大小限制
+    for expression, expected in [("1.0001 ** 5000", 1.0001 ** 5000), ("(-1) ** 1001", -1.0),
+                                 ("10 ** -1001", 0.0), ("0.5 ** 2000", 0.5 ** 2000),
+                                 ("1 ** 100000", 1.0), ("2 ** 1001", float(2 ** 1001))]:
+        result = calculate(expression)
+        assert result == expected, f"'{expression}'应为{expected}，但得到{result}"
+        print(f"  ✓ {expression} = {result}")
+    
+    # 不允许函数调用、名称等非算术表达式
+    for expression in ["__import__('os')", "abs(1)", "1 / 0", "9 ** 9 ** 9",
+                       "((9 ** 999) ** 999) ** 999", "(9 ** 999) ** 999 * (9 ** 999) ** 999"]:
+        try:
+            calculate(expression)
+        except ValueError:
+            print(f"  ✓ '{expression}' 被拒绝")
+        else:
+            raise AssertionError(f"'{expression}'应该被拒绝")
 
 
 def test_get_random_number():
@@ -144,6 +179,21 @@ def test_encode_decode_base64():
     decoded = decode_base64(encoded)
     assert decoded == text, f"解码结果不正确: {decoded}"
     print(f"  ✓ 解码: '{encoded}' -> '{decoded}'")
+    
+    # 含空白、按行折叠的输入与之前一样可以解码
+    for wrapped in ["aGVs bG8=", "aGVsbG8=\n", "SGVsbG8g\nV29ybGQ=\n"]:
+        decoded = decode_base64(wrapped)
+        assert decoded in ("hello", text), f"解码结果不正确: {decoded!r}"
+        print(f"  ✓ 解码: {wrapped!r} -> '{decoded}'")
+    
+    # 非 Base64 字符被拒绝
+    for invalid in ["!!", "aGV*sbG8=", "aGVsbG8=中"]:
+        try:
+            decode_base64(invalid)
+        except ValueError:
+            print(f"  ✓ {invalid!r} 被拒绝")
+        else:
+            raise AssertionError(f"{invalid!r}应该被拒绝")
 
 
 def test_check_prime():
@@ -165,6 +215,83 @@ def test_check_prime():
     assert result["is_prime"] == True, "2应该是质数"
     print(f"  ✓ 2: 是质数")
 
+    # 测试大数
+    result = check_prime(2 ** 61 - 1)
+    assert result["is_prime"] == True, "2^61-1应该是质数"
+    print(f"  ✓ 2^61-1: 是质数")
+
+    result = check_prime(1000003 * 1000033)
+    assert result["is_prime"] == False, "1000003*1000033不应该是质数"
+    print(f"  ✓ 1000003*1000033: 不是质数 ({result['reason']})")
+
+    # 测试浮点数输入
+    result = check_prime(7.0)
+    assert result["is_prime"] == True and result["number"] == 7, "7.0应该按整数7判断为质数"
+    print(f"  ✓ 7.0: 是质数")
+
+    for value in (7.5, float("nan"), float("inf"), "abc", None):
+        result = check_prime(value)
+        assert result["is_prime"] == False, f"{value!r}不应该是质数"
+    print(f"  ✓ 非整数输入返回错误说明 ({result['reason']})")
+
+
+def test_parse_json():
+    """测试JSON解析（NaN 和超过 64 位的整数与标准库结果一致）"""
+    print("测试 parse_json...")
+    
+    import json
+    text = '{"big": 123456789012345678901234567890, "nan": NaN, "inf": [Infinity, -Infinity]}'
+    result = DataProcessingTools.parse_json(text)
+    expected = json.dumps(json.loads(text), ensure_ascii=False, indent=2)
+    assert result == expected, f"解析结果应为{expected}，但得到{result}"
+    print(f"  ✓ 大整数和 NaN 解析结果与 json 模块一致")
+
+
+def test_ai_tool_result_json():
+    """测试 AI 工具结果可以作为普通字典序列化"""
+    print("测试 text_quality_analyzer 结果序列化...")
+    
+    import json
+    result = text_quality_analyzer("这是一段测试文本。This is a test.")
+    data = json.loads(json.dumps(dict(result), ensure_ascii=False))
+    assert isinstance(result["instruction"], str), "instruction 应为字符串"
+    assert data["instruction"] == result["instruction"], "序列化后的提示词不一致"
+    print(f"  ✓ json.dumps(dict(result)) 成功, 字段: {list(data)}")
+
+
+def test_statistics_calc_numpy():
+    """测试 statistics_calc 的 NumPy 路径与纯 Python 路径输出一致"""
+    print("测试 statistics_calc NumPy 路径...")
+    
+    if predefined_tools.np is None:
+        print("  - 未安装 NumPy，跳过")
+        return
+    
+    import math
+    import random
+    rng = random.Random(0)
+    datasets = {
+        "整数": [rng.randint(-50, 50) for _ in range(1001)],
+        "偶数长度整数": [rng.randint(-50, 50) for _ in range(1000)],
+        "四分之一小数": [rng.randint(-400, 400) / 4 for _ in range(1001)],
+    }
+    np_module = predefined_tools.np
+    for name, data in datasets.items():
+        for operation in ('mean', 'median', 'stdev', 'variance'):
+            with_numpy = CalculationTools.statistics_calc(data, operation)
+            predefined_tools.np = None
+            try:
+                pure = CalculationTools.statistics_calc(data, operation)
+            finally:
+                predefined_tools.np = np_module
+            # 数值格式（"2" 与 "2.0"）必须一致；标准差和方差允许浮点末位误差
+            assert ('.' in with_numpy) == ('.' in pure), f"{name} {operation} 格式不一致: {with_numpy} vs {pure}"
+            if operation in ('mean', 'median') or (name == "整数" and operation == 'variance'):
+                assert with_numpy == pure, f"{name} {operation} 结果不一致: {with_numpy} vs {pure}"
+            else:
+                assert math.isclose(float(with_numpy), float(pure), rel_tol=1e-12), f"{name} {operation} 结果不一致: {with_numpy} vs {pure}"
+    print(f"  ✓ mean/median/stdev/variance 两条路径输出一致")
+
 
 def run_all_tests():
     """运行所有测试"""
@@ -174,6 +301,7 @@ def run_all_tests():
     print()
     
     tests = [
+        test_calculate,
         test_get_random_number,
         test_convert_temperature,
         test_string_reverse,
@@ -182,7 +310,10 @@ def run_all_tests():
         test_calculate_age,
         test_generate_uuid,
         test_encode_decode_base64,
-        test_check_prime
+        test_check_prime,
+        test_parse_json,
+        test_ai_tool_result_json,
+        test_statistics_calc_numpy
     ]
     
     passed = 0
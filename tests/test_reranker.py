@@ -0,0 +1,95 @@
+"""
+测试重排序器的批量重排序
+
+使用桩模型代替交叉编码器，不需要下载模型
+"""
+
+import sys
+import os
+
+# 添加项目根目录到系统路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from langchain_core.documents import Document
+
+from src.shuyixiao_agent.rag.reranker import Reranker
+
+
+class _StubModel:
+    """按文档长度打分的桩模型，记录每次推理的输入对"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict(self, pairs, batch_size=32):
+        self.calls.append(list(pairs))
+        return [float(len(doc)) for _, doc in pairs]
+
+
+def _make_reranker(top_k: int = 2) -> Reranker:
+    """跳过模型加载，直接构造使用桩模型的重排序器"""
+    reranker = Reranker.__new__(Reranker)
+    reranker.model_name = "stub"
+    reranker.device = "cpu"
+    reranker.top_k = top_k
+    reranker.max_length = 512
+    reranker.model = _StubModel()
+    return reranker
+
+
+def test_rerank_many():
+    """测试多个查询合并为一次推理，并按各自的分数排序"""
+    print("测试 rerank_many...")
+
+    reranker = _make_reranker()
+    docs_a = [Document(page_content=text) for text in ["a", "aaa", "aa"]]
+    docs_b = [Document(page_content=text) for text in ["bb", "b"]]
+
+    results = reranker.rerank_many(["查询一", "查询二"], [docs_a, docs_b])
+
+    assert len(reranker.model.calls) == 1, "所有查询应合并为一次推理"
+    assert [doc.page_content for doc, _ in results[0]] == ["aaa", "aa"]
+    assert [doc.page_content for doc, _ in results[1]] == ["bb", "b"]
+    print(f"  ✓ 一次推理得到 {len(results)} 个查询的结果")
+
+
+def test_rerank_many_length_mismatch():
+    """测试查询数量与文档列表数量不一致时报错"""
+    print("测试 rerank_many 数量不一致...")
+
+    reranker = _make_reranker()
+    docs = [Document(page_content="text")]
+    for queries, docs_per_query in [(["q"], [docs, docs]), (["q1", "q2"], [docs])]:
+        try:
+            reranker.rerank_many(queries, docs_per_query)
+        except ValueError:
+            print(f"  ✓ {len(queries)} 个查询 / {len(docs_per_query)} 个文档列表 被拒绝")
+        else:
+            raise AssertionError("数量不一致时应该抛出 ValueError")
+
+
+def test_rerank_many_literal_query():
+    """测试精确字面查询与 rerank 一样跳过模型，保持原顺序"""
+    print("测试 rerank_many 字面查询...")
+
+    reranker = _make_reranker()
+    docs_literal = [Document(page_content=text) for text in ["x", "xxx"]]
+    docs_semantic = [Document(page_content=text) for text in ["y", "yyy"]]
+
+    results = reranker.rerank_many(
+        ["config.yaml", "语义查询"],
+        [docs_literal, docs_semantic]
+    )
+
+    assert all(query != "config.yaml" for query, _ in reranker.model.calls[0]), \
+        "字面查询不应送入模型"
+    assert [doc.page_content for doc, _ in results[0]] == ["x", "xxx"]
+    assert [doc.page_content for doc, _ in results[1]] == ["yyy", "y"]
+    print("  ✓ 字面查询保持原顺序，其他查询按模型分数排序")
+
+    # 全部是字面查询时不调用模型
+    reranker.model.calls.clear()
+    results = reranker.rerank_many(["config.yaml"], [docs_literal])
+    assert not reranker.model.calls, "全部为字面查询时不应调用模型"
+    assert [doc.page_content for doc, _ in results[0]] == ["x", "xxx"]
+    print("  ✓ 全部为字面查询时不调用模型")
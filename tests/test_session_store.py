@@ -0,0 +1,93 @@
+"""
+测试会话历史存储和聊天响应缓存
+
+Redis 实现使用 fakeredis，不需要真实的 Redis 服务
+"""
+
+import sys
+import os
+import asyncio
+
+# 添加项目根目录到系统路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import fakeredis
+
+from src.shuyixiao_agent.session_store import InMemorySessionStore, RedisSessionStore
+from src.shuyixiao_agent.response_cache import RedisResponseCache
+
+
+def _messages(count: int):
+    """生成 count 条交替角色的测试消息"""
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"消息{i}"}
+        for i in range(count)
+    ]
+
+
+async def _check_store(store):
+    """InMemorySessionStore 与 RedisSessionStore 共用的行为检查（max_messages=3）"""
+    for message in _messages(5):
+        await store.append("s1", message)
+    await store.append("s2", {"role": "user", "content": "其他会话"})
+
+    # 超出上限时只保留最近 3 条
+    assert await store.get("s1") == _messages(5)[-3:], "应只保留最近 3 条消息"
+
+    # recent 按时间顺序返回最后 count 条，count 超过已有条数时返回全部
+    assert await store.recent("s1", 2) == _messages(5)[-2:]
+    assert await store.recent("s1", 10) == _messages(5)[-3:]
+    assert await store.recent("missing", 2) == []
+
+    # 清除只影响指定会话
+    await store.clear("s1")
+    assert await store.get("s1") == []
+    assert await store.get("s2") == [{"role": "user", "content": "其他会话"}]
+
+
+def test_in_memory_session_store():
+    """测试进程内会话历史存储的裁剪和 recent"""
+    print("测试 InMemorySessionStore...")
+
+    asyncio.run(_check_store(InMemorySessionStore(max_messages=3)))
+    print("  ✓ 超出上限时丢弃最早的消息，recent 返回最近的消息")
+
+
+def test_redis_session_store():
+    """测试 Redis 会话历史存储的裁剪、recent 和过期时间"""
+    print("测试 RedisSessionStore...")
+
+    async def run():
+        store = RedisSessionStore("redis://localhost:6379/0", max_messages=3, ttl=60)
+        store._redis = fakeredis.FakeAsyncRedis()
+        await _check_store(store)
+
+        ttl = await store._redis.ttl("session:s2")
+        assert 0 < ttl <= 60, f"会话应设置过期时间，实际 TTL: {ttl}"
+
+    asyncio.run(run())
+    print("  ✓ LTRIM 只保留最近的消息，EXPIRE 设置了过期时间")
+
+
+def test_redis_response_cache():
+    """测试响应缓存的读写、过期时间和缓存键"""
+    print("测试 RedisResponseCache...")
+
+    async def run():
+        cache = RedisResponseCache("redis://localhost:6379/0", ttl=300)
+        cache._redis = fakeredis.FakeAsyncRedis()
+
+        key = cache.make_key("simple", None, "你好")
+        assert key.startswith("resp:")
+        assert key != cache.make_key("simple", "你是助手", "你好"), "系统消息不同时键应不同"
+        assert key != cache.make_key("tool", None, "你好"), "agent 类型不同时键应不同"
+
+        assert await cache.get(key) is None
+        await cache.set(key, "你好！")
+        assert await cache.get(key) == "你好！"
+
+        ttl = await cache._redis.ttl(key)
+        assert 0 < ttl <= 300, f"缓存应设置过期时间，实际 TTL: {ttl}"
+
+    asyncio.run(run())
+    print("  ✓ 写入后可读出，并设置了过期时间")
@@ -0,0 +1,162 @@
+"""
+测试流式聊天接口 /api/chat/stream
+
+使用桩客户端代替码云 AI 的流式接口，不需要 API Key 和网络
+"""
+
+import sys
+import os
+import asyncio
+
+# 添加项目根目录到系统路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import orjson
+from fastapi.testclient import TestClient
+
+from src.shuyixiao_agent import web_app
+from src.shuyixiao_agent.session_store import InMemorySessionStore
+
+
+class _StubClient:
+    """按给定的数据块依次返回流式增量的桩客户端"""
+
+    def __init__(self, chunks, delay: float = 0.0, endless: bool = False):
+        self.chunks = chunks
+        self.delay = delay
+        self.endless = endless
+        self.closed = False
+
+    async def achat_completion_stream(self, messages, **kwargs):
+        try:
+            while True:
+                for content in self.chunks:
+                    if self.delay:
+                        await asyncio.sleep(self.delay)
+                    yield {"choices": [{"delta": {"content": content}}]}
+                if not self.endless:
+                    return
+        finally:
+            self.closed = True
+
+
+class _patched_app:
+    """替换 web_app 的共享客户端和会话存储，退出时恢复"""
+
+    def __init__(self, client):
+        self.client = client
+        self.store = InMemorySessionStore(max_messages=50)
+
+    def __enter__(self):
+        self._saved = (web_app.get_gitee_client, web_app.session_store)
+        web_app.get_gitee_client = lambda: self.client
+        web_app.session_store = self.store
+        return self
+
+    def __exit__(self, *exc):
+        web_app.get_gitee_client, web_app.session_store = self._saved
+
+
+def _parse_frames(body: bytes):
+    """把 SSE 响应体解析为数据帧列表"""
+    return [
+        orjson.loads(frame[len(b"data: "):])
+        for frame in body.split(b"\n\n")
+        if frame.startswith(b"data: ")
+    ]
+
+
+def test_chat_stream_coalesces_frames():
+    """测试已到达的小数据块被合并为较少的 SSE 帧，并保存完整回复"""
+    print("测试 /api/chat/stream 合并数据块...")
+
+    chunks = [f"第{i}块" for i in range(40)]
+    with _patched_app(_StubClient(chunks)) as patched:
+        response = TestClient(web_app.app).post(
+            "/api/chat/stream",
+            json={"message": "你好", "session_id": "stream-test"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers, "SSE 响应不应被压缩"
+
+        frames = _parse_frames(response.content)
+        content_frames = [frame for frame in frames if not frame["done"]]
+        assert frames[-1] == {"content": "", "done": True}, "最后一帧应为完成信号"
+        assert 0 < len(content_frames) < len(chunks), \
+            f"{len(chunks)} 个数据块应合并为更少的帧，实际 {len(content_frames)} 帧"
+        assert "".join(frame["content"] for frame in content_frames) == "".join(chunks)
+        print(f"  ✓ {len(chunks)} 个数据块合并为 {len(content_frames)} 帧")
+
+        history = asyncio.run(patched.store.get("stream-test"))
+        assert history == [
+            {"role": "user", "content": "你好"},
+            {"role": "assistant", "content": "".join(chunks)},
+        ]
+        print("  ✓ 完整回复已写入会话历史")
+
+
+async def _stream_until_first_frame(payload: dict):
+    """
+    直接调用 ASGI 应用，收到第一个数据帧后模拟客户端断开
+
+    TestClient 会读完整个响应体，无法在无限的流中途断开，这里按 ASGI 协议
+    在第一个数据帧发出后返回 http.disconnect
+    """
+    body = orjson.dumps(payload)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/chat/stream",
+        "raw_path": b"/api/chat/stream",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    first_frame_sent = asyncio.Event()
+    request_sent = False
+    frames = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await first_frame_sent.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            frames.append(message["body"])
+            first_frame_sent.set()
+
+    await asyncio.wait_for(web_app.app(scope, receive, send), timeout=5)
+    return frames
+
+
+def test_chat_stream_saves_history_on_disconnect():
+    """测试客户端中途断开时保存已生成的回复，并关闭上游流"""
+    print("测试 /api/chat/stream 中途断开...")
+
+    client = _StubClient(["片段"], delay=0.01, endless=True)
+    with _patched_app(client) as patched:
+        frames = asyncio.run(_stream_until_first_frame(
+            {"message": "讲个长故事", "session_id": "disconnect-test"}
+        ))
+        sent = "".join(frame["content"] for frame in _parse_frames(b"".join(frames)))
+        assert sent, "断开前应至少发送一个数据帧"
+
+        history = asyncio.run(patched.store.get("disconnect-test"))
+        assert history[0] == {"role": "user", "content": "讲个长故事"}
+        assert history[1]["role"] == "assistant"
+        assert history[1]["content"].startswith(sent), "应保存断开前已生成的回复"
+        assert client.closed, "断开后应关闭上游流"
+        print(f"  ✓ 断开后保存了 {len(history[1]['content'])} 个字符的回复，上游流已关闭")